@@ -7,7 +7,7 @@ import os  # <--- 이 부분이 빠져있어서 에러가 났습니다! 꼭 필
 from flask import Flask, render_template, session
 
 from config import Config
-from database import db
+from database import db, upgrade_schema
 from datetime import timedelta  # KST 변환용
 
 # SQLAlchemy가 모델을 인식하도록 모델 전체 import
@@ -47,6 +47,15 @@ def create_app() -> Flask:
             return ""
         return (value + timedelta(hours=9)).strftime("%Y-%m-%d %H:%M")
 
+    # 모든 템플릿에서 상단 알림 배지에 쓸 읽지 않은 알림 수 (기본 키 조회 한 번)
+    @app.context_processor
+    def inject_unread_notifications():
+        user_id = session.get("user_id")
+        if not user_id:
+            return {"unread_notification_count": 0}
+        from services.notification_service import NotificationService
+        return {"unread_notification_count": NotificationService.unread_count(user_id)}
+
     # 주요 섹션으로 이동할 수 있는 간단한 홈 페이지입니다.
     @app.route("/")
     def index() -> str:
@@ -57,9 +66,21 @@ def create_app() -> Flask:
 if __name__ == "__main__":
     application = create_app()
 
-    # 최초 실행 시 테이블 생성
+    # 최초 실행 시 테이블 생성, 기존 DB에 새 컬럼 추가, 매칭용 태그 색인 구축, 팀원 수/읽지 않은 알림 수 보정
     with application.app_context():
         db.create_all()
+        upgrade_schema()
+        from services.notification_service import NotificationService
+        from services.tag_service import TagService
+        from services.team_service import TeamService
+        TagService.ensure_index()
+        TeamService.reconcile_member_counts()
+        NotificationService.reconcile_unread_counts()
+
+    # 매칭 계산 등 백그라운드 작업 워커 시작 (별도 프로세스로 실행하는 경우 생략)
+    if Config.START_WORKER_WITH_APP:
+        from worker import start_in_thread
+        start_in_thread(application)
 
     # Railway 환경변수 포트 가져오기 (기본값 5000)
     port = int(os.environ.get("PORT", 5000))
@@ -0,0 +1,259 @@
+"""
+매칭 성능 벤치마크입니다.
+
+임시 SQLite 데이터베이스에 합성 사용자/프로필/클래스/팀을 생성한 뒤
+점수 계산, 후보 조회, 매칭 작업 처리, 매칭 화면 렌더링 시간을 측정합니다.
+결과는 처리량과 백분위수(p50/p95/p99)로 출력되며, 커밋 간 비교를 위해
+JSON 파일로 저장됩니다.
+
+사용 예::
+
+    python benchmarks/bench_matching.py --users 1000 10000 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+from config import Config  # noqa: E402
+from database import db  # noqa: E402
+
+# 실제 프로필에 자주 등장하는 기술/목표/성격 태그
+COMMON_SKILLS = [
+    "python", "java", "javascript", "typescript", "react", "vue", "spring", "django",
+    "flask", "node", "sql", "mysql", "postgresql", "mongodb", "aws", "docker",
+    "kubernetes", "git", "figma", "photoshop", "illustrator", "기획", "디자인", "마케팅",
+    "데이터분석", "머신러닝", "딥러닝", "pytorch", "tensorflow", "c", "c++", "c#",
+    "unity", "swift", "kotlin", "android", "ios", "flutter", "go", "rust",
+    "linux", "excel", "발표", "문서작성", "영상편집", "ui", "ux", "devops",
+]
+GOALS = ["창업", "포트폴리오", "공모전", "수상", "학점", "취업", "스터디", "해커톤", "논문", "오픈소스"]
+PERSONALITIES = ["성실", "소통", "리더십", "꼼꼼함", "창의적", "적극적", "차분함", "책임감"]
+
+
+def build_vocab(size: int) -> list[str]:
+    """자주 쓰이는 태그 뒤에 드물게 쓰이는 합성 태그를 붙인 어휘를 만듭니다."""
+    vocab = list(COMMON_SKILLS)
+    vocab += [f"skill-{i}" for i in range(max(size - len(vocab), 0))]
+    return vocab[:size]
+
+
+def zipf_sample(rng: random.Random, vocab: list[str], weights: list[float], k: int) -> list[str]:
+    """앞쪽 태그일수록 자주 뽑히는 (Zipf 분포) 중복 없는 표본입니다."""
+    picked: dict[str, None] = {}
+    while len(picked) < k:
+        picked[rng.choices(vocab, weights=weights)[0]] = None
+    return list(picked)
+
+
+def seed_population(n_users: int, n_classes: int, teams_per_class: int, vocab_size: int, seed: int) -> dict:
+    """합성 데이터를 대량 삽입하고 측정 대상 팀/사용자 ID를 반환합니다."""
+    from models import ClassMember, ClassRoom, Profile, Team, TeamMember, TeamTag, User, UserTag
+    from services.tag_service import TagService
+
+    rng = random.Random(seed)
+    vocab = build_vocab(vocab_size)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    password = generate_password_hash("bench")
+
+    users, profiles, user_tags, class_members = [], [], [], []
+    for uid in range(1, n_users + 1):
+        skills = ", ".join(zipf_sample(rng, vocab, weights, rng.randint(1, 5)))
+        goals = ", ".join(rng.sample(GOALS, rng.randint(1, 2)))
+        personality = rng.choice(PERSONALITIES)
+        users.append({"id": uid, "username": f"user{uid}", "password": password,
+                      "name": f"사용자{uid}", "student_no": f"{20000000 + uid}", "school": "벤치대학교"})
+        profiles.append({"user_id": uid, "skills": skills, "goals": goals, "personality": personality})
+        for kind, value in ((TagService.SKILL, skills), (TagService.GOAL, goals),
+                            (TagService.PERSONALITY, personality)):
+            user_tags += [{"user_id": uid, "kind": kind, "tag": tag} for tag in TagService.tokenize_csv(value)]
+        class_members.append({"class_id": (uid - 1) % n_classes + 1, "user_id": uid, "role": "MEMBER"})
+
+    classes = [{"id": cid, "name": f"클래스{cid}", "code": f"B{cid:05d}", "owner_id": 1}
+               for cid in range(1, n_classes + 1)]
+
+    teams, team_tags, team_members = [], [], []
+    team_id = 0
+    for cid in range(1, n_classes + 1):
+        for _ in range(teams_per_class):
+            team_id += 1
+            required = ", ".join(zipf_sample(rng, vocab, weights, rng.randint(2, 5)))
+            goal = f"{rng.choice(GOALS)} 목표로 {rng.choice(PERSONALITIES)} 팀원 모집"
+            owner = rng.randrange(cid, n_users + 1, n_classes) if n_users >= cid else 1
+            teams.append({"id": team_id, "name": f"팀{team_id}", "goal": goal, "required_skills": required,
+                          "capacity": rng.randint(3, 6), "member_count": 1, "owner_id": owner,
+                          "class_id": cid})
+            team_members.append({"team_id": team_id, "user_id": owner, "role": "LEADER"})
+            team_tags += [{"team_id": team_id, "kind": TagService.SKILL, "tag": t}
+                          for t in TagService.tokenize_csv(required)]
+            team_tags += [{"team_id": team_id, "kind": TagService.GOAL, "tag": t}
+                          for t in TagService.tokenize_words(goal)]
+
+    for model, rows in ((User, users), (Profile, profiles), (ClassRoom, classes), (ClassMember, class_members),
+                        (UserTag, user_tags), (Team, teams), (TeamMember, team_members), (TeamTag, team_tags)):
+        if rows:
+            db.session.execute(db.insert(model), rows)
+    db.session.commit()
+
+    sample_teams = rng.sample(range(1, team_id + 1), min(team_id, 20))
+    sample_users = rng.sample(range(1, n_users + 1), min(n_users, 20))
+    return {"teams": sample_teams, "users": sample_users}
+
+
+def measure(fn, repeat: int, items=None) -> dict:
+    """``fn``을 ``repeat``번 실행한 소요 시간의 통계를 반환합니다."""
+    durations, total_items = [], 0
+    for i in range(repeat):
+        start = time.perf_counter()
+        result = fn(i)
+        durations.append(time.perf_counter() - start)
+        total_items += items(result) if items else 1
+    ms = sorted(d * 1000 for d in durations)
+    pct = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    return {
+        "runs": repeat,
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(pct[49], 3),
+        "p95_ms": round(pct[94], 3),
+        "p99_ms": round(pct[98], 3),
+        "throughput_per_s": round(total_items / sum(durations), 1) if sum(durations) else None,
+    }
+
+
+def run_size(n_users: int, args: argparse.Namespace) -> dict:
+    """한 인구 규모에 대해 데이터를 생성하고 각 단계를 측정합니다."""
+    from app import create_app
+    from models import Team
+    from services.matching_job_service import MatchingJobService
+    from services.matching_service import MatchingService
+    from services.ranking_service import RankingService
+
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="bench_")
+    os.close(fd)
+    Config.SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+    app = create_app()
+    try:
+        with app.app_context():
+            db.create_all()
+            started = time.perf_counter()
+            sample = seed_population(n_users, args.classes, args.teams_per_class, args.vocab, args.seed)
+            seed_seconds = time.perf_counter() - started
+
+            teams = [db.session.get(Team, tid) for tid in sample["teams"]]
+            pick = lambda i: teams[i % len(teams)]  # noqa: E731
+            pools = {t.id: MatchingService.find_candidates(t) for t in teams}
+
+            def score_single(i):
+                team = pick(i)
+                return [MatchingService.calculate_score(u, team) for u in pools[team.id]]
+
+            def score_batch(i):
+                team = pick(i)
+                return MatchingService.score_candidates(pools[team.id], team)
+
+            def retrieval(i):
+                db.session.expire_all()
+                return MatchingService.find_candidates(pick(i))
+
+            def precompute(i):
+                job = MatchingJobService.enqueue(pick(i).id)
+                MatchingJobService.run_pending()
+                return job
+
+            def rank_teams(i):
+                uid = sample["users"][i % len(sample["users"])]
+                return RankingService.rank_teams(uid, class_id=(uid - 1) % args.classes + 1)[0]
+
+            results = {
+                "score_single": measure(score_single, args.repeat, len),
+                "score_batch": measure(score_batch, args.repeat, len),
+                "candidate_retrieval": measure(retrieval, args.repeat, len),
+                "precompute_job": measure(precompute, min(args.repeat, len(teams))),
+                "rank_teams_sql": measure(rank_teams, args.repeat, len),
+            }
+
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["user_id"] = teams[0].owner_id
+
+        def render_page(i):
+            response = client.get(f"/matching/{sample['teams'][i % len(sample['teams'])]}")
+            assert response.status_code == 200
+            return response
+
+        results["matching_page"] = measure(render_page, args.repeat)
+        results["seed_seconds"] = round(seed_seconds, 2)
+        results["avg_candidates"] = round(statistics.fmean(len(p) for p in pools.values()), 1)
+        return results
+    finally:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+        os.remove(path)
+
+
+def git_commit() -> str | None:
+    try:
+        # 다른 디렉터리에서 실행해도 이 저장소의 커밋을 기록
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       cwd=REPO_ROOT, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="매칭 성능 벤치마크")
+    parser.add_argument("--users", type=int, nargs="+", default=[1000], help="측정할 사용자 수 (여러 개 지정 가능)")
+    parser.add_argument("--classes", type=int, default=10, help="클래스 수")
+    parser.add_argument("--teams-per-class", type=int, default=20, help="클래스당 팀 수")
+    parser.add_argument("--vocab", type=int, default=300, help="기술 태그 어휘 크기")
+    parser.add_argument("--repeat", type=int, default=20, help="단계별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: benchmarks/results/<커밋>-<시각>.json)")
+    args = parser.parse_args()
+
+    # 벤치마크 중에는 백그라운드 워커 스레드를 띄우지 않고 직접 작업을 처리합니다.
+    Config.START_WORKER_WITH_APP = False
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "results": {},
+    }
+    for n_users in args.users:
+        print(f"== users={n_users}")
+        results = run_size(n_users, args)
+        report["results"][str(n_users)] = results
+        print(f"   seed {results['seed_seconds']}s, 평균 후보 {results['avg_candidates']}명")
+        for name, stats in results.items():
+            if isinstance(stats, dict):
+                print(f"   {name:<20} p50 {stats['p50_ms']:>9.3f}ms  p95 {stats['p95_ms']:>9.3f}ms  "
+                      f"p99 {stats['p99_ms']:>9.3f}ms  {stats['throughput_per_s']}/s")
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"{report['commit'] or 'local'}-{datetime.now().strftime('%Y%m%d%H%M%S')}.json",
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump(report, fp, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
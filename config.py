@@ -31,3 +31,50 @@ class Config:
     # 모델 변경이 발생할 때마다 애플리케이션에 신호를 보내는 기능을 비활성화합니다.
     # 불필요한 오버헤드가 발생할 수 있기 때문에 대부분의 경우 끄는 것이 좋습니다.
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # 팀 구분 라벨("클래스: 이름")에 쓰는 클래스/카테고리 이름을 프로세스 안에 캐시해 둘 시간(초)입니다.
+    TEAM_LABEL_CACHE_TTL = float(os.environ.get("TEAM_LABEL_CACHE_TTL", 300))
+
+    # 클래스 팀 자동 편성 시 (학생 수 × 팀 수)가 이 값 이상이면 프로세스 풀로 점수를 계산합니다.
+    AUTO_FORM_PARALLEL_THRESHOLD = int(os.environ.get("AUTO_FORM_PARALLEL_THRESHOLD", 20000))
+    # 자동 편성에 사용할 프로세스 수입니다. (0이면 CPU 코어 수)
+    AUTO_FORM_WORKERS = int(os.environ.get("AUTO_FORM_WORKERS", 0))
+
+    # 백그라운드 워커가 작업 큐를 확인하는 주기(초)입니다.
+    WORKER_POLL_INTERVAL = float(os.environ.get("WORKER_POLL_INTERVAL", 1.0))
+    # app.py 실행 시 백그라운드 워커를 같은 프로세스의 스레드로 함께 시작할지 여부입니다.
+    # 별도 프로세스로 ``python worker.py``를 실행하는 경우 0으로 설정합니다.
+    START_WORKER_WITH_APP = os.environ.get("START_WORKER_WITH_APP", "1") == "1"
+    # 매칭 작업 하나가 저장할 최대 후보 수입니다. 상위 후보만 힙으로 골라 저장합니다. (0이면 전체 저장)
+    MATCHING_RESULT_LIMIT = int(os.environ.get("MATCHING_RESULT_LIMIT", 500))
+    # RUNNING 상태로 이 시간(초)보다 오래 남은 매칭 작업은 워커가 중단된 것으로 보고 다시 대기시킵니다.
+    MATCHING_JOB_TIMEOUT = int(os.environ.get("MATCHING_JOB_TIMEOUT", 600))
+    # 백그라운드 워커가 중단된 매칭 작업을 확인하는 주기(초)입니다.
+    MATCHING_STALE_CHECK_INTERVAL = float(os.environ.get("MATCHING_STALE_CHECK_INTERVAL", 60))
+    # 백그라운드 워커가 사용자별 읽지 않은 알림 카운터를 실제 알림 수와 다시 맞추는 주기(초)입니다.
+    UNREAD_RECONCILE_INTERVAL = float(os.environ.get("UNREAD_RECONCILE_INTERVAL", 3600))
+    # 실시간 알림 스트림(SSE)이 다른 프로세스에서 생성된 알림을 확인하려고 DB를 다시 읽는 주기(초)입니다.
+    # 같은 프로세스의 알림은 커밋 즉시 전달되며, 이 주기마다 연결 유지용 신호도 함께 보냅니다.
+    NOTIFICATION_STREAM_POLL_INTERVAL = float(os.environ.get("NOTIFICATION_STREAM_POLL_INTERVAL", 5.0))
+
+    # 알림 보존 정책입니다. 읽은 알림 중 보존 기간(일)이 지난 것과
+    # 사용자별 최근 알림 수 한도를 넘는 것을 주기적으로 정리합니다.
+    NOTIFICATION_RETENTION_DAYS = int(os.environ.get("NOTIFICATION_RETENTION_DAYS", 90))
+    NOTIFICATION_MAX_PER_USER = int(os.environ.get("NOTIFICATION_MAX_PER_USER", 500))
+    # 1이면 정리 대상을 notification_archive 테이블로 옮기고, 0이면 바로 삭제합니다.
+    NOTIFICATION_ARCHIVE = os.environ.get("NOTIFICATION_ARCHIVE", "1") == "1"
+    # 한 트랜잭션에서 옮기거나 지울 최대 알림 수와 한 번 실행할 때의 최대 배치 수입니다.
+    NOTIFICATION_RETENTION_BATCH = int(os.environ.get("NOTIFICATION_RETENTION_BATCH", 1000))
+    NOTIFICATION_RETENTION_MAX_BATCHES = int(os.environ.get("NOTIFICATION_RETENTION_MAX_BATCHES", 20))
+    # 알림 정리 작업 실행 주기(초)입니다.
+    NOTIFICATION_RETENTION_INTERVAL = float(os.environ.get("NOTIFICATION_RETENTION_INTERVAL", 6 * 3600))
+
+    # 백그라운드 워커가 알림 아웃박스에서 한 번에 가져가 전달할 알림 수입니다.
+    NOTIFICATION_OUTBOX_BATCH = int(os.environ.get("NOTIFICATION_OUTBOX_BATCH", 500))
+    # 1이면 아웃박스에서 전달한 알림을 로그로도 남깁니다. (푸시/이메일 전송 대용)
+    NOTIFICATION_LOG_DELIVERY = os.environ.get("NOTIFICATION_LOG_DELIVERY", "0") == "1"
+    # 같은 사용자·종류·대상의 읽지 않은 알림을 한 행으로 합치는 시간 창(초)입니다.
+    NOTIFICATION_COALESCE_WINDOW = int(os.environ.get("NOTIFICATION_COALESCE_WINDOW", 3600))
+
+    # '매칭 점수순' 정렬에 쓰는 팀/사용자 점수 캐시의 최대 항목 수입니다. (LRU 방식으로 제거)
+    MATCH_SCORE_CACHE_SIZE = int(os.environ.get("MATCH_SCORE_CACHE_SIZE", 50000))
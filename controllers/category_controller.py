@@ -9,11 +9,15 @@ from flask import Blueprint, render_template, request, session, flash
 
 from services.category_service import CategoryService
 from services.team_service import TeamService
+from services.ranking_service import RankingService
 from models.category import Category
 from services.team_service import TeamService
 
 category_bp = Blueprint("category", __name__)
 
+# '매칭 점수순' 정렬 시 한 번에 표시할 팀 수
+PAGE_SIZE = 20
+
 
 @category_bp.route("/", methods=["GET", "POST"])
 def list_and_create():
@@ -37,53 +41,43 @@ def list_and_create():
 @category_bp.route("/<int:category_id>")
 def detail(category_id: int):
     """Display category detail with its teams."""
-    from flask import request, session
-    from models.user import User
-
     category = Category.query.get_or_404(category_id)
-    teams = TeamService.list_teams_for_category(category_id)
 
     # 정렬 기준 파라미터 (없으면 기본 정렬)
     sort_mode = request.args.get("sort", "default")
-
-    if sort_mode == "match":
-        user_id = session.get("user_id")
-        if user_id:
-            user = User.query.get(user_id)
-            profile = getattr(user, "profile", None)
-
-            # 사용자 태그(성격, 목표, 기술)를 한 번에 모아두기
-            user_tags: list[str] = []
-            if profile:
-                for field in ("personality", "goals", "skills"):
-                    value = getattr(profile, field, None)
-                    if value:
-                        user_tags.extend(
-                            [t.strip().lower() for t in value.split(",") if t.strip()]
-                        )
-
-            def calc_match_score(team):
-                """사용자 태그와 팀 필요 역량(required_skills)의 교집합 개수로 점수 계산."""
-                if not user_tags or not team.required_skills:
-                    return 0
-                team_tags = [
-                    t.strip().lower()
-                    for t in team.required_skills.split(",")
-                    if t.strip()
-                ]
-                return len(set(user_tags) & set(team_tags))
-
-            # 점수 높은 순 → 동점이면 id 큰 순으로
-            teams = sorted(
-                teams,
-                key=lambda t: (calc_match_score(t), t.id),
-                reverse=True,
-            )
+    user_id = session.get("user_id")
+    next_after = None
+    # 목록 필터: 모집 중인 팀만 / 남은 자리가 있는 팀만
+    open_only = request.args.get("open", type=int) == 1
+    has_seats = request.args.get("seats", type=int) == 1
+
+    if sort_mode == "match" and user_id:
+        # 점수 높은 순 → 동점이면 id 큰 순으로, 한 페이지만 SQL에서 집계/정렬
+        ranked, next_cursor = RankingService.rank_teams(
+            user_id,
+            category_id=category_id,
+            limit=PAGE_SIZE,
+            after=RankingService.decode_cursor(request.args.get("after")),
+            filters=TeamService.listing_filters(open_only, has_seats),
+        )
+        teams = [team for team, _ in ranked]
+        next_after = RankingService.encode_cursor(*next_cursor) if next_cursor else None
+    else:
+        # 기본 정렬: 팀 ID 순 키셋 페이지네이션 (팀원 수는 teams.member_count 사용)
+        teams, next_id = TeamService.list_teams_for_category(
+            category_id,
+            limit=PAGE_SIZE,
+            after=request.args.get("after", type=int),
+            open_only=open_only,
+            has_seats=has_seats,
+        )
+        next_after = next_id
 
     return render_template(
         "category_detail.html",
         category=category,
         teams=teams,
         sort_mode=sort_mode,  # 템플릿에서 현재 정렬 기준 표시용
+        next_after=next_after,
     )
 
@@ -10,11 +10,15 @@ from flask import Blueprint, render_template, request, redirect, url_for, sessio
 
 from services.class_service import ClassService
 from services.team_service import TeamService
+from services.ranking_service import RankingService
 from models.class_ import ClassRoom  # noqa: F401 imported for type reference
 
 
 class_bp = Blueprint("class", __name__)
 
+# '매칭 점수순' 정렬 시 한 번에 표시할 팀 수
+PAGE_SIZE = 20
+
 
 @class_bp.route("/")
 def list_classes() -> str:
@@ -73,49 +77,59 @@ def join() -> str:
 @class_bp.route("/<int:class_id>")
 def detail(class_id: int) -> str:
     """Display a single class and its teams."""
-    from flask import request, session   
-    from models.user import User         
-
     clazz = ClassRoom.query.get_or_404(class_id)
-    teams = TeamService.list_teams_for_class(class_id)
-    
+
     # 정렬 모드
     sort_mode = request.args.get("sort")
+    user_id = session.get("user_id")
+    next_after = None
+    # 목록 필터: 모집 중인 팀만 / 남은 자리가 있는 팀만
+    open_only = request.args.get("open", type=int) == 1
+    has_seats = request.args.get("seats", type=int) == 1
+
+    if sort_mode == "match" and user_id:
+        # 점수 높은 순 → 동점이면 id 큰 순으로, 한 페이지만 SQL에서 집계/정렬
+        ranked, next_cursor = RankingService.rank_teams(
+            user_id,
+            class_id=class_id,
+            limit=PAGE_SIZE,
+            after=RankingService.decode_cursor(request.args.get("after")),
+            filters=TeamService.listing_filters(open_only, has_seats),
+        )
+        teams = [team for team, _ in ranked]
+        next_after = RankingService.encode_cursor(*next_cursor) if next_cursor else None
+    else:
+        # 기본 정렬: 팀 ID 순 키셋 페이지네이션 (팀원 수는 teams.member_count 사용)
+        teams, next_id = TeamService.list_teams_for_class(
+            class_id,
+            limit=PAGE_SIZE,
+            after=request.args.get("after", type=int),
+            open_only=open_only,
+            has_seats=has_seats,
+        )
+        next_after = next_id
 
-    if sort_mode == "match":
-        user_id = session.get("user_id")
-
-        if user_id:
-            user = User.query.get(user_id)
-            profile = getattr(user, "profile", None)
-
-            # 사용자 태그(성격, 목표, 기술)
-            user_tags = []
-            if profile:
-                for field in ("personality", "goals", "skills"):
-                    value = getattr(profile, field, None)
-                    if value:
-                        user_tags.extend(
-                            [t.strip().lower() for t in value.split(",") if t.strip()]
-                        )
-
-            def calc_match_score(team):
-                if not user_tags or not team.required_skills:
-                    return 0
-                team_tags = [
-                    t.strip().lower()
-                    for t in team.required_skills.split(",")
-                    if t.strip()
-                ]
-                return len(set(user_tags) & set(team_tags))
-
-            teams = sorted(
-                teams,
-                key=lambda t: (calc_match_score(t), t.id),
-                reverse=True,
-            )
-    
-    return render_template("class_detail.html", clazz=clazz, class_room=clazz, teams=teams)
+    return render_template(
+        "class_detail.html", clazz=clazz, class_room=clazz, teams=teams, next_after=next_after
+    )
+
+@class_bp.route("/<int:class_id>/auto-form", methods=["POST"])
+def auto_form(class_id: int):
+    """팀이 없는 클래스 멤버를 매칭 점수 기반으로 팀에 자동 배정 (클래스 대표만 가능)"""
+    user_id = session.get("user_id")
+    if not user_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for("user.login"))
+
+    team_size = request.form.get("team_size", 4, type=int)
+    try:
+        result = ClassService.auto_form_teams(class_id, user_id, team_size)
+        flash(f"{result['assigned']}명을 배정했습니다. (새로 만든 팀 {result['created']}개)")
+        if result["unassigned"]:
+            flash(f"{result['unassigned']}명은 함께 묶을 학생이 없어 배정하지 못했습니다.")
+    except ValueError as exc:
+        flash(str(exc))
+    return redirect(url_for("class.detail", class_id=class_id))
 
 @class_bp.route("/<int:class_id>/dissolve", methods=["POST"])
 def dissolve(class_id: int):
@@ -1,53 +1,96 @@
 """
 매칭 기능 블루프린트
 
-- 특정 팀에 적합한 후보 사용자 목록 계산 및 표시
-- MatchingService를 이용하여 점수를 계산하고 후보자를 정렬
+- 특정 팀에 적합한 후보 사용자 목록 표시
+- 후보자 순위는 백그라운드 워커가 미리 계산해 두고, 화면은 저장된 결과를 조회
+- 결과가 없거나 오래되었으면 팀장이 POST /<team_id>/refresh로 계산 요청 등록
+  (조회(GET)는 상태를 바꾸지 않으므로 크롤러나 새로고침이 작업을 쌓지 않음)
 - 팀 리더 여부 확인 후 템플릿에서 권한 표시
+- 사용자에게 맞는 모집 중인 팀을 클래스/카테고리 전체에서 추천
 """
 
-from flask import Blueprint, render_template, session
+from flask import Blueprint, render_template, request, session, redirect, url_for, flash
+
 from models.team import Team
-from models.user import User
-from models.team_member import TeamMember
-from models.class_member import ClassMember
-from services.matching_service import MatchingService
+from services.class_service import ClassService
+from services.matching_job_service import MatchingJobService
+from services.ranking_service import RankingService
 
 matching_bp = Blueprint("matching", __name__)
 
+# 한 번에 표시할 후보자 수
+PAGE_SIZE = 20
+
+@matching_bp.route("/teams-for-me")
+def teams_for_me():
+    """
+    현재 사용자에게 맞는 팀 추천
+
+    - 참여 중인 모든 클래스와 전체 카테고리의 모집 중이고 자리가 남은 팀 대상
+    - 사용자 태그와 팀 필요 기술의 일치 개수 순으로 한 페이지씩 표시
+    """
+    user_id = session.get("user_id")
+    if not user_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for("user.login"))
+
+    class_ids = [c.id for c in ClassService.get_classes_for_user(user_id)]
+    ranked, next_cursor = RankingService.recommend_teams(
+        user_id,
+        class_ids,
+        limit=PAGE_SIZE,
+        after=RankingService.decode_cursor(request.args.get("after")),
+    )
+    return render_template(
+        "team_recommendations.html",
+        teams=ranked,
+        next_after=RankingService.encode_cursor(*next_cursor) if next_cursor else None,
+    )
+
+
 @matching_bp.route("/<int:team_id>")
 def match(team_id: int):
     # 1. 팀 정보 가져오기
     team = Team.query.get_or_404(team_id)
 
-    # 2. 현재 팀 멤버 ID 리스트 가져오기
-    member_ids = [m.user_id for m in TeamMember.query.filter_by(team_id=team_id).all()]
-
-    # 3. 후보자 조회
-    if team.class_id:  # 팀이 클래스에 속해 있다면
-        # 같은 클래스에 속한 사용자만 후보
-        candidates = (
-            User.query
-            .join(ClassMember, ClassMember.user_id == User.id)
-            .filter(ClassMember.class_room.has(id=team.class_id))
-            .filter(~User.id.in_(member_ids))
-            .all()
-        )
-    else:
-        # 클래스가 없으면 모든 사용자 후보, 단 같은 팀 멤버 제외
-        candidates = User.query.filter(~User.id.in_(member_ids)).all()
-    
-    # 4. 후보자 점수 계산
-    scored_candidates = MatchingService.match_candidates(candidates, team)
-
-    # 5. 현재 로그인 사용자가 팀 리더인지 확인
+    # 2. 현재 로그인 사용자가 팀 리더인지 확인
     current_user_id = session.get("user_id")
     is_leader = current_user_id == team.owner_id
 
-    # 6. 결과 렌더링
+    # 3. 미리 계산된 결과 확인 (없거나 오래되었으면 화면에서 계산 요청 안내)
+    latest = MatchingJobService.latest_done(team_id)
+    pending = MatchingJobService.active_request(team_id)
+    outdated = pending is None and MatchingJobService.is_outdated(latest, team)
+
+    # 4. 저장된 순위에서 현재 페이지에 해당하는 후보만 조회
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    scored_candidates, has_more = (
+        MatchingJobService.get_results(latest, PAGE_SIZE, offset) if latest else ([], False)
+    )
+    next_offset = offset + PAGE_SIZE if has_more else None
+
+    # 5. 결과 렌더링
     return render_template(
         "matching_results.html",
         team=team,
         candidates=scored_candidates,
-        is_leader=is_leader
+        is_leader=is_leader,
+        offset=offset,
+        next_offset=next_offset,
+        computed_at=latest.finished_at if latest else None,
+        pending=pending is not None,
+        outdated=outdated,
     )
+
+
+@matching_bp.route("/<int:team_id>/refresh", methods=["POST"])
+def refresh(team_id: int):
+    """팀장이 후보자 순위를 다시 계산하도록 요청합니다."""
+    team = Team.query.get_or_404(team_id)
+    current_user_id = session.get("user_id")
+    if current_user_id != team.owner_id:
+        flash("팀장만 매칭을 다시 요청할 수 있습니다.")
+    else:
+        MatchingJobService.enqueue(team_id, requested_by=current_user_id)
+        flash("매칭 후보를 다시 계산하고 있습니다.")
+    return redirect(url_for("matching.match", team_id=team_id))
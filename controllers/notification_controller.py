@@ -2,16 +2,28 @@
 알림 기능 블루프린트
 
 - 현재 로그인한 사용자에게 초대, 승인, 거절 등 알림 목록 표시
-- NotificationService를 통해 알림 읽음 처리
+- 알림 목록은 (생성일, ID) 기준 키셋 페이지네이션으로 한 페이지씩 조회
+- NotificationService를 통해 알림 읽음 처리 (개별 / 전체 / 종류별 / 대상별)
+- Server-Sent Events 스트림으로 새 알림을 실시간 전달
 """
 
-from flask import Blueprint, render_template, session, request, redirect, url_for, flash
+import json
+import queue
 
-from models.notification import Notification
+from flask import Blueprint, Response, render_template, session, request, redirect, url_for, flash, stream_with_context
+
+from config import Config
+from database import db
+from services import notification_bus
 from services.notification_service import NotificationService
 
 notification_bp = Blueprint("notification", __name__)
 
+# 한 번에 표시할 알림 수
+PAGE_SIZE = 30
+# 스트림이 한 번에 DB에서 읽어 전달할 최대 알림 수
+STREAM_BATCH = 50
+
 # ----------------------------
 # / (list_notifications)
 # 사용자 알림 목록 조회
@@ -23,6 +35,7 @@ def list_notifications():
 
     - 로그인 안 되어 있으면 로그인 페이지로 리다이렉트
     - 알림은 생성일 기준 내림차순으로 정렬
+    - ``before`` 커서 이후의 한 페이지만 조회, ``unread=1``이면 읽지 않은 알림만 표시
     - TEST: 로그인/로그아웃 상태, 알림 정렬 확인
     """
     user_id = session.get("user_id")
@@ -30,12 +43,87 @@ def list_notifications():
         flash("로그인이 필요합니다.")
         return redirect(url_for("user.login"))
 
-    notifications = (
-        Notification.query.filter_by(user_id=user_id)
-        .order_by(Notification.created_at.desc())
-        .all()
+    unread_only = request.args.get("unread", type=int) == 1
+    notifications, next_before = NotificationService.list_for_user(
+        user_id,
+        limit=PAGE_SIZE,
+        before=NotificationService.decode_cursor(request.args.get("before")),
+        unread_only=unread_only,
+    )
+    return render_template(
+        "notification_list.html",
+        notifications=notifications,
+        unread_only=unread_only,
+        next_before=NotificationService.encode_cursor(*next_before) if next_before else None,
+    )
+
+
+# ----------------------------
+# /stream
+# 실시간 알림 스트림 (SSE)
+# ----------------------------
+@notification_bp.route("/stream")
+def stream():
+    """
+    현재 사용자에게 새 알림을 Server-Sent Events로 전달
+
+    - 같은 프로세스에서 커밋된 알림은 notification_bus 신호로 즉시 전달
+    - 다른 프로세스의 알림은 일정 주기로 DB를 확인해 전달 (연결 유지 신호 겸용)
+    - 재연결 시 브라우저가 보내는 Last-Event-ID 이후의 알림부터 이어서 전달
+    - 연결이 열려 있는 동안 요청 스레드 하나를 계속 차지하므로(개발 서버는 연결당 스레드),
+      base.html은 브라우저 탭 전체에서 연결을 하나만 열어 공유
+    """
+    user_id = session.get("user_id")
+    if not user_id:
+        return Response(status=401)
+
+    last_id = request.headers.get("Last-Event-ID", type=int)
+    if last_id is None:
+        last_id = NotificationService.latest_id(user_id)
+    db.session.remove()
+
+    def events():
+        nonlocal last_id
+        waiter = notification_bus.subscribe(user_id)
+        backlog = False
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                # 밀린 알림이 남아 있으면 기다리지 않고 바로 다음 묶음 전달
+                if not backlog:
+                    try:
+                        waiter.get(timeout=Config.NOTIFICATION_STREAM_POLL_INTERVAL)
+                    except queue.Empty:
+                        pass
+                try:
+                    new = NotificationService.list_since(user_id, last_id, limit=STREAM_BATCH)
+                    unread = NotificationService.unread_count(user_id) if new else None
+                finally:
+                    # 연결이 열려 있는 동안 DB 연결/트랜잭션을 붙잡지 않도록 바로 반환
+                    db.session.remove()
+                if not new:
+                    backlog = False
+                    yield ": keep-alive\n\n"
+                    continue
+                for n in new:
+                    payload = {
+                        "id": n.id,
+                        "type": n.type,
+                        "message": n.message,
+                        "related_id": n.related_id,
+                        "unread": unread,
+                    }
+                    yield f"id: {n.id}\nevent: notification\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                last_id = new[-1].id
+                backlog = len(new) == STREAM_BATCH
+        finally:
+            notification_bus.unsubscribe(user_id, waiter)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return render_template("notification_list.html", notifications=notifications)
 
 
 # ----------------------------
@@ -58,3 +146,29 @@ def mark_notification_read(notification_id: int):
         return redirect(url_for("user.login"))
     NotificationService.mark_as_read(notification_id, user_id)
     return redirect(request.referrer or url_for("notification.list_notifications"))
+
+
+# ----------------------------
+# /read-all
+# 알림 일괄 읽음 처리
+# ----------------------------
+@notification_bp.route("/read-all", methods=["POST"])
+def mark_all_read():
+    """
+    읽지 않은 알림을 한 번에 읽음 처리
+
+    - 폼의 ``type``이 있으면 해당 종류의 알림만, ``related_id``가 있으면 해당 대상의 알림만 처리
+    - 조건에 맞는 알림을 UPDATE 한 번으로 처리하고 읽지 않은 알림 카운터도 함께 갱신
+    """
+    user_id = session.get("user_id")
+    if not user_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for("user.login"))
+    count = NotificationService.mark_all_read(
+        user_id,
+        type=request.form.get("type") or None,
+        related_id=request.form.get("related_id", type=int),
+    )
+    if count:
+        flash(f"알림 {count}개를 읽음 처리했습니다.")
+    return redirect(request.referrer or url_for("notification.list_notifications"))
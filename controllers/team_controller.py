@@ -5,7 +5,7 @@
 비즈니스 로직은 ``TeamService``에 위임됩니다.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash
+from flask import Blueprint, abort, render_template, request, redirect, url_for, session, flash
 
 from services.team_service import TeamService
 from services.class_service import ClassService
@@ -76,55 +76,11 @@ def list_my_teams():
 @team_bp.route("/<int:team_id>")
 def team_detail(team_id: int):
     """Show details of a team and its members."""
-    from models.team import Team
-    from models.team_member import TeamMember
-    team = Team.query.get_or_404(team_id)
-    memberships = TeamMember.query.filter_by(team_id=team_id).all()
-    # Build list of member dict with user info
-    from models.user import User
-    members = []
-    for mem in memberships:
-        user = User.query.get(mem.user_id)
-        members.append({'member': mem, 'user': user})
-    current_user_id = session.get("user_id")
-    # Determine if leader
-    is_leader = current_user_id == team.owner_id
-    # Pending applications
-    from models.team_application import TeamApplication
-    applications = []
-    # Pending invitations for leader to view
-    from models.team_invitation import TeamInvitation
-    invitations = []
-    if is_leader:
-        invs = TeamInvitation.query.filter_by(team_id=team_id, status="PENDING").all()
-        # Build list with user info
-        from models.user import User
-        for inv in invs:
-            user = User.query.get(inv.to_user_id)
-            invitations.append({'invitation': inv, 'user': user})
-        pending_apps = TeamApplication.query.filter_by(team_id=team_id, status="PENDING").all()
-        for app in pending_apps:
-            user = User.query.get(app.user_id)
-            applications.append({'application': app, 'user': user})
-    # Determine membership and pending application/invite for current user
-    user_member = None
-    user_pending_application = None
-    user_pending_invite = None
-    if current_user_id:
-        user_member = TeamMember.query.filter_by(team_id=team_id, user_id=current_user_id).first()
-        user_pending_application = TeamApplication.query.filter_by(team_id=team_id, user_id=current_user_id, status="PENDING").first()
-        user_pending_invite = TeamInvitation.query.filter_by(team_id=team_id, to_user_id=current_user_id, status="PENDING").first()
-    return render_template(
-        "team_detail.html",
-        team=team,
-        members=members,
-        is_leader=is_leader,
-        applications=applications,
-        invitations=invitations,
-        user_member=user_member,
-        user_pending_application=user_pending_application,
-        user_pending_invite=user_pending_invite,
-    )
+    # 팀, 팀원, 대기 중인 지원/초대를 팀 크기와 관계없이 고정된 수의 쿼리로 조회
+    detail = TeamService.build_team_detail(team_id, session.get("user_id"))
+    if detail is None:
+        abort(404)
+    return render_template("team_detail.html", **detail)
 
 
 @team_bp.route("/apply/<int:team_id>", methods=["POST"])
@@ -151,6 +107,37 @@ def process_application(application_id: int, action: str):
     return redirect(request.referrer or url_for("team.list_my_teams"))
 
 
+@team_bp.route("/<int:team_id>/applications/batch", methods=["POST"])
+def process_applications(team_id: int):
+    """Accept or reject the selected applications, or accept the best matches until full."""
+    current_user_id = session.get("user_id")
+    if not current_user_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for("user.login"))
+
+    action = request.form.get("action")
+    try:
+        if action == "accept_top":
+            # 최대 인원은 비워 두면 정원까지, 숫자가 아니면 처리하지 않음 (1 미만은 서비스에서 거부)
+            top_n = request.form.get("top_n", type=int)
+            if top_n is None and request.form.get("top_n", "").strip():
+                flash("승인할 인원은 숫자로 입력해 주세요.")
+                return redirect(url_for("team.team_detail", team_id=team_id))
+            result = TeamService.process_applications(team_id, current_user_id, accept=True, top_n=top_n)
+        else:
+            application_ids = request.form.getlist("application_ids", type=int)
+            if not application_ids:
+                flash("처리할 지원을 선택해 주세요.")
+                return redirect(url_for("team.team_detail", team_id=team_id))
+            result = TeamService.process_applications(
+                team_id, current_user_id, accept=action == "accept", application_ids=application_ids
+            )
+        flash(f"지원 {result['accepted']}건을 승인하고 {result['rejected']}건을 거절했습니다.")
+    except ValueError as exc:
+        flash(str(exc))
+    return redirect(url_for("team.team_detail", team_id=team_id))
+
+
 # --- New management and invitation routes ---
 
 @team_bp.route("/invite/<int:team_id>/<int:user_id>", methods=["POST"])
@@ -168,6 +155,29 @@ def invite_user(team_id: int, user_id: int):
     return redirect(request.referrer or url_for("team.team_detail", team_id=team_id))
 
 
+@team_bp.route("/invite/<int:team_id>/bulk", methods=["POST"])
+def invite_users(team_id: int):
+    """Invite every selected user to the team at once (leader only)."""
+    current_user_id = session.get("user_id")
+    if not current_user_id:
+        flash("로그인이 필요합니다.")
+        return redirect(url_for("user.login"))
+    user_ids = request.form.getlist("user_ids", type=int)
+    if not user_ids:
+        flash("초대할 사용자를 선택해 주세요.")
+        return redirect(request.referrer or url_for("team.team_detail", team_id=team_id))
+    try:
+        results = TeamService.invite_users(team_id, current_user_id, user_ids)
+    except ValueError as exc:
+        flash(str(exc))
+        return redirect(request.referrer or url_for("team.team_detail", team_id=team_id))
+
+    invited = sum(1 for result in results.values() if result == "INVITED")
+    skipped = len(results) - invited
+    flash(f"{invited}명에게 초대를 보냈습니다." + (f" ({skipped}명은 초대하지 못했습니다.)" if skipped else ""))
+    return redirect(request.referrer or url_for("team.team_detail", team_id=team_id))
+
+
 @team_bp.route("/invitation/<int:invitation_id>/<string:action>", methods=["POST"])
 def process_invitation(invitation_id: int, action: str):
     """Accept or reject a team invitation."""
@@ -277,15 +287,14 @@ def edit_team(team_id: int):
             flash("팀 이름은 필수입니다.")
             return redirect(url_for("team.edit_team", team_id=team_id))
 
-        # 여기서 TeamService 써도 되고, 직접 업데이트해도 됨
-        team.name = name
-        team.goal = goal
-        team.required_skills = required_skills
-        team.capacity = capacity
-        team.openchat_url = openchat_url
-
-        from database import db
-        db.session.commit()
+        TeamService.update_team(
+            team,
+            name=name,
+            goal=goal,
+            required_skills=required_skills,
+            capacity=capacity,
+            openchat_url=openchat_url,
+        )
 
         flash("팀 정보가 수정되었습니다.")
         return redirect(url_for("team.team_detail", team_id=team_id))
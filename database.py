@@ -11,3 +11,52 @@ from flask_sqlalchemy import SQLAlchemy
 # SQLAlchemy 객체 생성.
 # 실제 초기화는 ``app.py``의 ``create_app`` 함수에서 Flask 앱과 함께 이루어집니다.
 db = SQLAlchemy()
+
+# 기존 테이블에 나중에 추가된 컬럼 목록: (테이블, 컬럼)
+# ``db.create_all()``은 이미 있는 테이블을 바꾸지 않으므로,
+# 기존 테이블에 컬럼을 추가할 때는 여기에도 등록해야 합니다.
+# NOT NULL 컬럼은 기존 행을 채울 수 있도록 모델에 server_default가 있어야 합니다.
+SCHEMA_UPGRADES = [
+    ("teams", "version"),
+    ("teams", "member_count"),
+    ("profiles", "version"),
+    ("users", "unread_notification_count"),
+    ("notifications", "count"),
+    ("notification_archive", "count"),
+    ("notification_archive", "original_id"),
+    ("matching_requests", "requested_by"),
+    ("matching_requests", "status"),
+    ("matching_requests", "team_version"),
+    ("matching_requests", "started_at"),
+    ("matching_requests", "finished_at"),
+    ("matching_requests", "error"),
+]
+
+
+def upgrade_schema() -> None:
+    """Add columns and indexes that existing databases are missing.
+
+    Safe to run on every start: a column is only added when the table does
+    not have it yet, and an index only when it does not exist. Column DDL is
+    rendered from the model for the connected database, the same way
+    ``db.create_all()`` renders it, so it works on SQLite, PostgreSQL and
+    MySQL alike. Call after ``db.create_all()``.
+    """
+    with db.engine.begin() as conn:
+        inspector = db.inspect(conn)
+        compiler = conn.dialect.ddl_compiler(conn.dialect, None)
+        for table_name, column_name in SCHEMA_UPGRADES:
+            existing = {col["name"] for col in inspector.get_columns(table_name)}
+            if column_name in existing:
+                continue
+            column = db.metadata.tables[table_name].c[column_name]
+            conn.execute(
+                db.text(
+                    f"ALTER TABLE {compiler.preparer.format_table(column.table)} "
+                    f"ADD COLUMN {compiler.get_column_specification(column)}"
+                )
+            )
+        # 기존 테이블에 나중에 정의된 인덱스 생성
+        for table in db.metadata.tables.values():
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
@@ -11,7 +11,12 @@ from .team_member import TeamMember
 from .team_application import TeamApplication
 from .team_invitation import TeamInvitation
 from .notification import Notification
+from .notification_archive import NotificationArchive
+from .notification_outbox import NotificationOutbox
 from .matching_request import MatchingRequest
+from .matching_result import MatchingResult
+from .user_tag import UserTag
+from .team_tag import TeamTag
 
 __all__ = [
     "User",
@@ -25,5 +30,10 @@ __all__ = [
     "TeamApplication",
     "TeamInvitation",
     "Notification",
+    "NotificationArchive",
+    "NotificationOutbox",
     "MatchingRequest",
+    "MatchingResult",
+    "UserTag",
+    "TeamTag",
 ]
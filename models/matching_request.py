@@ -2,6 +2,8 @@
 매칭 요청 모델입니다.
 
 팀장이 특정 기준에 따라 잠재적인 팀원을 찾기 위해 요청한 내용을 저장합니다.
+요청은 작업 큐로 사용되며, 백그라운드 워커가 PENDING 상태의 요청을 가져가
+후보자 순위를 계산하고 ``MatchingResult``에 저장합니다.
 """
 
 from database import db
@@ -12,4 +14,13 @@ class MatchingRequest(BaseModel):
     __tablename__ = "matching_requests"
 
     team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False)
-    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False) #요청 시점은 항상 존재해야하기에 'nullable=False' 추가
\ No newline at end of file
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False) #요청 시점은 항상 존재해야하기에 'nullable=False' 추가
+    requested_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default="PENDING", server_default="PENDING")  # PENDING, RUNNING, DONE, FAILED
+    # 계산 당시 팀 버전 (팀 정보가 수정되면 결과를 다시 계산하기 위해 사용)
+    team_version = db.Column(db.Integer, nullable=True)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    error = db.Column(db.String(255), nullable=True)
+
+    __table_args__ = (db.Index("ix_matching_requests_status", "status", "id"),)  # 워커가 가장 오래된 대기 요청을 찾기 위한 인덱스
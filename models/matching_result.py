@@ -0,0 +1,24 @@
+"""
+매칭 결과 모델입니다.
+
+백그라운드 워커가 ``MatchingRequest``를 처리하며 계산한 후보자 순위를 저장합니다.
+매칭 화면은 이 테이블에서 한 페이지씩 조회하므로 요청 처리 중에 점수를 다시
+계산하지 않습니다.
+"""
+
+from database import db
+from .base import BaseModel
+
+
+class MatchingResult(BaseModel):
+    __tablename__ = "matching_results"
+
+    request_id = db.Column(db.Integer, db.ForeignKey("matching_requests.id"), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    score = db.Column(db.Integer, nullable=False)
+    rank = db.Column(db.Integer, nullable=False)
+
+    user = db.relationship("User")
+
+    __table_args__ = (db.Index("ix_matching_results_request_rank", "request_id", "rank"),)  # 순위 순서로 한 페이지씩 조회하기 위한 인덱스
@@ -4,12 +4,20 @@
 사용자에게 전송되는 알림을 나타냅니다. 초대, 승인, 거절, 추방 등
 여러 상황에 활용될 수 있으며, type 필드는 알림 종류를,
 related_id는 관련 초대, 신청, 팀 등의 ID를 저장할 수 있습니다.
+알림함은 (user_id, created_at, id) 복합 인덱스를 따라 한 페이지씩 조회합니다.
+짧은 시간에 반복되는 같은 종류의 알림은 한 행으로 합쳐지고 count에 횟수가 기록됩니다.
 """
 
 
+from sqlalchemy.dialects import sqlite
+
 from database import db
 from .base import BaseModel
 
+# SQLite의 CURRENT_TIMESTAMP와 같은 형식("YYYY-MM-DD HH:MM:SS")으로 저장·비교해
+# 알림함 커서에 담긴 시각이 저장된 값과 그대로 비교되도록 함
+_CREATED_AT_TYPE = db.DateTime().with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
 
 class Notification(BaseModel):
     __tablename__ = "notifications"
@@ -18,5 +26,10 @@ class Notification(BaseModel):
     type = db.Column(db.String(50), nullable=False)
     message = db.Column(db.String(255), nullable=False)
     related_id = db.Column(db.Integer, nullable=True)
-    created_at = db.Column(db.DateTime, server_default=db.func.now())
-    read_at = db.Column(db.DateTime, nullable=True)
\ No newline at end of file
+    created_at = db.Column(_CREATED_AT_TYPE, server_default=db.func.now())
+    read_at = db.Column(db.DateTime, nullable=True)
+    count = db.Column(db.Integer, nullable=False, default=1, server_default="1")  # 같은 (사용자, 종류, 대상) 알림이 합쳐진 횟수
+
+    __table_args__ = (
+        db.Index("ix_notifications_user_created", "user_id", "created_at", "id"),  # 사용자별 최신순 키셋 페이지네이션용 인덱스
+    )
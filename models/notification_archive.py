@@ -0,0 +1,28 @@
+"""
+보관된 알림 모델입니다.
+
+보존 기간이 지났거나 사용자별 보관 한도를 넘은 읽은 알림은
+``notifications`` 테이블에서 이 테이블로 옮겨집니다. 알림함 화면은
+이 테이블을 조회하지 않으므로 자주 쓰는 알림 테이블과 인덱스가 작게 유지됩니다.
+"""
+
+
+from database import db
+from .base import BaseModel
+
+
+class NotificationArchive(BaseModel):
+    __tablename__ = "notification_archive"
+
+    # 원본 알림 ID. notifications.id는 삭제 후 다시 쓰일 수 있으므로 기본 키로 쓰지 않음
+    original_id = db.Column(db.Integer, nullable=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    type = db.Column(db.String(50), nullable=False)
+    message = db.Column(db.String(255), nullable=False)
+    related_id = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime)
+    read_at = db.Column(db.DateTime)
+    count = db.Column(db.Integer, nullable=False, default=1, server_default="1")  # 합쳐진 알림 횟수 (원본 그대로)
+    archived_at = db.Column(db.DateTime, server_default=db.func.now())
+
+    __table_args__ = (db.Index("ix_notification_archive_user", "user_id"),)
@@ -0,0 +1,21 @@
+"""
+알림 아웃박스 모델입니다.
+
+팀 지원/초대 처리 같은 업무 트랜잭션은 알림을 바로 알림함에 넣지 않고
+같은 트랜잭션 안에서 이 테이블에 기록만 합니다. 백그라운드 워커가
+쌓인 행을 배치로 가져가 ``notifications``(알림함)와 외부 전송 채널에 전달한 뒤 삭제합니다.
+"""
+
+
+from database import db
+from .base import BaseModel
+
+
+class NotificationOutbox(BaseModel):
+    __tablename__ = "notification_outbox"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    type = db.Column(db.String(50), nullable=False)
+    message = db.Column(db.String(255), nullable=False)
+    related_id = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, server_default=db.func.now())
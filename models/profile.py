@@ -17,5 +17,7 @@ class Profile(BaseModel):
     personality = db.Column(db.String(255))
     goals = db.Column(db.String(255))
     skills = db.Column(db.String(255))
+    # 프로필이 수정될 때마다 증가하며, 매칭 점수 캐시가 최신인지 확인하는 기준으로 사용됩니다.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     __table_args__ = (db.UniqueConstraint("user_id", name="uq_profile_user"),) #한 유저가 하나의 프로필만 가지도록 제약 추가
\ No newline at end of file
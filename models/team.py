@@ -25,5 +25,10 @@ class Team(BaseModel):
     # Optional open chat URL for team meetings or external chat invitations
     openchat_url = db.Column(db.String(255), nullable=True)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # 팀 정보가 수정될 때마다 증가하며, 저장된 매칭 결과가 최신인지 확인하는 기준으로 사용됩니다.
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    # 현재 팀원 수. 팀원 추가/삭제 시 함께 갱신되며, 정원 확인은 이 값을 조건부 UPDATE로 증가시켜 처리합니다.
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
-    members = db.relationship("TeamMember", backref="team", cascade="all, delete-orphan")
\ No newline at end of file
+    members = db.relationship("TeamMember", backref="team", cascade="all, delete-orphan")
+    tags = db.relationship("TeamTag", backref="team", cascade="all, delete-orphan")
\ No newline at end of file
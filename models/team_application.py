@@ -18,4 +18,6 @@ class TeamApplication(BaseModel):
     message = db.Column(db.Text)
     status = db.Column(db.String(20), default="PENDING")
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    decided_at = db.Column(db.DateTime, nullable=True)
\ No newline at end of file
+    decided_at = db.Column(db.DateTime, nullable=True)
+
+    user = db.relationship("User")
@@ -19,4 +19,6 @@ class TeamInvitation(BaseModel):
     to_user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     status = db.Column(db.String(20), default="PENDING")
     created_at = db.Column(db.DateTime, server_default=db.func.now())
-    responded_at = db.Column(db.DateTime, nullable=True)
\ No newline at end of file
+    responded_at = db.Column(db.DateTime, nullable=True)
+
+    to_user = db.relationship("User", foreign_keys=[to_user_id])
@@ -18,4 +18,6 @@ class TeamMember(BaseModel):
     role = db.Column(db.String(20), default="MEMBER")
     joined_at = db.Column(db.DateTime, server_default=db.func.now())
 
+    user = db.relationship("User")
+
     __table_args__ = (db.UniqueConstraint("team_id", "user_id", name="uq_team_member"),) #같은 팀에 같은 유저가 중복으로 가입되지 않도록 제한 추가
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+팀 태그 모델입니다.
+
+팀의 필요 기술(required_skills)과 목표(goal)를 토큰 단위로 정규화해 저장합니다.
+``UserTag``와 태그 값으로 조인하면 사용자와 팀의 태그 일치 개수를
+SQL의 ``GROUP BY``로 계산할 수 있습니다.
+"""
+
+
+from database import db
+from .base import BaseModel
+
+
+class TeamTag(BaseModel):
+    __tablename__ = "team_tags"
+
+    team_id = db.Column(db.Integer, db.ForeignKey("teams.id"), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    tag = db.Column(db.String(255), nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint("team_id", "kind", "tag", name="uq_team_tag"),  # 같은 팀에 같은 태그가 중복 저장되지 않도록 제약 추가
+        db.Index("ix_team_tags_kind_tag", "kind", "tag"),  # 태그 → 팀 조회용 색인
+    )
@@ -4,6 +4,8 @@
 시스템에 등록된 사용자를 나타내며, 각 사용자는 고유한
 username과 학번, 해시된 비밀번호, 이름을 가집니다.
 사용자는 연결 테이블을 통해 여러 클래스와 팀에 속할 수 있습니다.
+읽지 않은 알림 수는 ``unread_notification_count``에 미리 집계해 두어
+상단 알림 배지를 그릴 때 알림 테이블을 세지 않아도 됩니다.
 """
 
 
@@ -19,6 +21,7 @@ class User(BaseModel):
     name = db.Column(db.String(50), nullable=False)
     student_no = db.Column(db.String(20), unique=True, nullable=False)
     school = db.Column(db.String(100))
+    unread_notification_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 알림 배지용 비정규화 카운터 (NotificationService가 관리)
 
     # One-to-one relationship to Profile. ``uselist=False`` makes
     # SQLAlchemy return a single object rather than a list.
@@ -0,0 +1,24 @@
+"""
+사용자 태그 역색인 모델입니다.
+
+프로필의 기술(skills), 목표(goals), 성격(personality) 문자열을 토큰 단위로
+나누어 저장합니다. (kind, tag) 인덱스를 통해 특정 태그를 가진 사용자를
+전체 사용자 테이블을 훑지 않고 바로 찾을 수 있으며, 매칭 후보 조회에 사용됩니다.
+"""
+
+
+from database import db
+from .base import BaseModel
+
+
+class UserTag(BaseModel):
+    __tablename__ = "user_tags"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)
+    tag = db.Column(db.String(255), nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint("user_id", "kind", "tag", name="uq_user_tag"),  # 같은 사용자에게 같은 태그가 중복 저장되지 않도록 제약 추가
+        db.Index("ix_user_tags_kind_tag", "kind", "tag"),  # 태그 → 사용자 조회용 역색인
+    )
@@ -25,6 +25,9 @@ class CategoryService:
         category = Category(name=name, created_by=created_by)
         db.session.add(category)
         db.session.commit()
+        # 같은 ID로 캐시된 이전 카테고리 이름이 팀 라벨에 쓰이지 않도록 제거
+        from services.team_service import TeamService
+        TeamService.invalidate_label(category_id=category.id)
         return category
 
     @staticmethod
@@ -5,8 +5,10 @@
 고유 참여 코드와 멤버십 관리 같은 비즈니스 규칙을 포함합니다.
 """
 
+import heapq
 import random
 import string
+from collections import Counter
 from typing import List
 
 from database import db
@@ -38,6 +40,9 @@ class ClassService:
         member = ClassMember(class_id=clazz.id, user_id=owner_id, role="ADMIN")
         db.session.add(member)
         db.session.commit()
+        # 같은 ID로 캐시된 이전 클래스 이름이 팀 라벨에 쓰이지 않도록 제거
+        from services.team_service import TeamService
+        TeamService.invalidate_label(class_id=clazz.id)
         return clazz
 
     @staticmethod
@@ -53,6 +58,9 @@ class ClassService:
         # 3. 일반 멤버 권한으로 가입 처리
         member = ClassMember(class_id=clazz.id, user_id=user_id, role="MEMBER")
         db.session.add(member)
+        # 4. 후보 풀이 바뀌었으므로 클래스 팀들의 매칭 결과를 다시 계산 대상으로 표시
+        from services.matching_job_service import MatchingJobService
+        MatchingJobService.mark_outdated_for_class(clazz.id)
         db.session.commit()
         return member
 
@@ -68,10 +76,149 @@ class ClassService:
         #ID리스트에 포함된 클래스들을 한 번에 조회
         return ClassRoom.query.filter(ClassRoom.id.in_(class_ids)).all() if class_ids else []
     
+    @staticmethod
+    def auto_form_teams(class_id: int, by_user_id: int, team_size: int = 4) -> dict:
+        """Assign every unassigned class member to a team and commit once.
+
+        Members are placed greedily in descending ``MatchingService`` score
+        order into the class's OPEN teams without exceeding ``Team.capacity``
+        (teams without a capacity accept anyone). Members left over once all
+        seats are taken are grouped into new teams of ``team_size``; a last
+        group of one joins the previous new team, and a single leftover
+        member with no new team to join stays unassigned.
+        Returns the number of members assigned, teams created and members
+        left unassigned.
+        """
+        from models.profile import Profile
+        from models.team import Team
+        from models.team_member import TeamMember
+        from services.matching_service import MatchingService
+        from services.notification_service import NotificationService
+
+        # 1. 권한 확인
+        clazz = ClassRoom.query.get(class_id)
+        if not clazz:
+            raise ValueError("존재하지 않는 클래스입니다.")
+        if clazz.owner_id != by_user_id:
+            raise ValueError("팀을 자동 편성할 권한이 없습니다.")
+        if team_size < 2:
+            raise ValueError("팀 인원은 2명 이상이어야 합니다.")
+
+        # 2. 아직 팀이 없는 클래스 멤버(관리자 제외)와 프로필 조회
+        assigned_ids = (
+            db.session.query(TeamMember.user_id)
+            .join(Team, Team.id == TeamMember.team_id)
+            .filter(Team.class_id == class_id)
+        )
+        rows = (
+            db.session.query(ClassMember.user_id, Profile.skills, Profile.personality, Profile.goals)
+            .outerjoin(Profile, Profile.user_id == ClassMember.user_id)
+            .filter(
+                ClassMember.class_id == class_id,
+                ClassMember.role != "ADMIN",
+                ~ClassMember.user_id.in_(assigned_ids),
+            )
+            .order_by(ClassMember.id)
+            .all()
+        )
+        user_ids = [r[0] for r in rows]
+        if not user_ids:
+            return {"assigned": 0, "created": 0, "unassigned": 0}
+
+        # 3. 모집 중인 팀과 남은 자리 계산 (정원이 없으면 무제한)
+        teams = Team.query.filter_by(class_id=class_id, recruit_status="OPEN").order_by(Team.id).all()
+        seats = [
+            None if t.capacity is None else max(t.capacity - t.member_count, 0)
+            for t in teams
+        ]
+
+        # 4. 점수가 높은 (학생, 팀) 쌍부터 자리가 있으면 배정
+        #    모든 쌍을 정렬하지 않고, 학생마다 자리가 남은 팀 중 최고점 팀 하나만 힙에 넣음.
+        #    꺼낸 팀이 그 사이 가득 찼으면 그 학생의 최고점 팀만 다시 계산해 넣음
+        placement: dict[int, int] = {}
+        if teams:
+            matrix = MatchingService.score_matrix([tuple(r[1:]) for r in rows], teams)
+
+            def best_team(i: int):
+                """Return (-score, i, j) for student ``i``'s best team with a free seat, or None."""
+                scores = matrix[i]
+                best = None
+                for j, free in enumerate(seats):
+                    if free != 0 and (best is None or scores[j] > scores[best]):
+                        best = j
+                return None if best is None else (-scores[best], i, best)
+
+            heap = [entry for entry in map(best_team, range(len(rows))) if entry is not None]
+            heapq.heapify(heap)
+            while heap:
+                _, i, j = heapq.heappop(heap)
+                if seats[j] == 0:
+                    entry = best_team(i)
+                    if entry is not None:
+                        heapq.heappush(heap, entry)
+                    continue
+                placement[i] = j
+                if seats[j] is not None:
+                    seats[j] -= 1
+
+        for i, j in placement.items():
+            db.session.add(TeamMember(team_id=teams[j].id, user_id=user_ids[i], role="MEMBER"))
+        # 기존 팀의 자리를 조건부 UPDATE로 확보 (그 사이 다른 승인으로 자리가 찼으면 전체 취소)
+        from services.team_service import TeamService
+        for j, placed in Counter(placement.values()).items():
+            if not TeamService.claim_seat(teams[j].id, placed):
+                db.session.rollback()
+                raise ValueError("편성 중 팀 정원이 변경되었습니다. 다시 시도해 주세요.")
+
+        # 5. 남은 학생은 새 팀으로 묶기 (첫 번째 학생이 팀장)
+        #    마지막 묶음이 1명이면 앞 묶음에 합치고, 합칠 묶음이 없으면 배정하지 않음
+        leftovers = [user_ids[i] for i in range(len(rows)) if i not in placement]
+        groups = [leftovers[start:start + team_size] for start in range(0, len(leftovers), team_size)]
+        unassigned: List[int] = []
+        if groups and len(groups[-1]) == 1:
+            if len(groups) > 1:
+                groups[-2].extend(groups.pop())
+            else:
+                unassigned = groups.pop()
+        created = 0
+        for group in groups:
+            created += 1
+            team = Team(
+                name=f"{clazz.name} 자동 편성 {created}팀",
+                capacity=max(team_size, len(group)),
+                member_count=len(group),
+                owner_id=group[0],
+                class_id=class_id,
+            )
+            db.session.add(team)
+            db.session.flush()
+            for idx, uid in enumerate(group):
+                db.session.add(
+                    TeamMember(team_id=team.id, user_id=uid, role="LEADER" if idx == 0 else "MEMBER")
+                )
+
+        # 6. 배정 알림 후 한 번에 커밋
+        NotificationService.enqueue(
+            (
+                {
+                    "user_id": uid,
+                    "type": "TEAM_AUTO_ASSIGNED",
+                    "message": f"[클래스: {clazz.name}] 팀이 자동으로 배정되었습니다.",
+                    "related_id": class_id,
+                }
+                for uid in user_ids
+                if uid not in unassigned
+            ),
+        )
+        db.session.commit()
+        return {"assigned": len(user_ids) - len(unassigned), "created": created, "unassigned": len(unassigned)}
+
     @staticmethod
     def dissolve_class(class_id: int, by_user_id: int) -> None:
         """클래스를 해체하고, 클래스 내 팀과 사용자에게 알림을 전송합니다."""
         from services.notification_service import NotificationService
+        from services.matching_job_service import MatchingJobService
+        from services.ranking_service import RankingService
         from models.team import Team
         from models.team_member import TeamMember
 
@@ -84,34 +231,47 @@ class ClassService:
         if clazz.owner_id != by_user_id:
             raise ValueError("클래스를 해체할 권한이 없습니다.")
 
-        # 3. 클래스 내 모든 팀 해체
+        # 3. 클래스 내 모든 팀 해체 (팀 멤버 알림은 한 번에 조회해 모아 둠)
         teams = Team.query.filter_by(class_id=class_id).all()
+        team_ids = [team.id for team in teams]
+        team_names = {team.id: team.name for team in teams}
+        notifications = [
+            {
+                "user_id": mem_user_id,
+                "type": "TEAM_DISSOLVED",
+                "message": f"[{team_names[mem_team_id]}] 팀이 클래스 해체로 인해 삭제되었습니다.",
+                "related_id": mem_team_id,
+            }
+            for mem_team_id, mem_user_id in (
+                db.session.query(TeamMember.team_id, TeamMember.user_id)
+                .filter(TeamMember.team_id.in_(team_ids), TeamMember.user_id != by_user_id)
+                .order_by(TeamMember.team_id, TeamMember.id)
+                .all()
+            )
+        ] if team_ids else []
         for team in teams:
-            # 팀 멤버에게 알림 전송
-            members = TeamMember.query.filter_by(team_id=team.id).all()
-            for mem in members:
-                if mem.user_id != by_user_id:
-                    NotificationService.send_notification(
-                        mem.user_id,
-                        "TEAM_DISSOLVED",
-                        f"[{team.name}] 팀이 클래스 해체로 인해 삭제되었습니다.",
-                        related_id=team.id
-                    )
-            # 팀 삭제
+            # 팀 삭제 (매칭 작업/결과 포함)
+            MatchingJobService.purge_team(team.id)
+            RankingService.forget_team(team.id)
             db.session.delete(team)
 
-        # 4. 클래스 멤버에게 알림 전송 후 삭제
+        # 4. 클래스 멤버에게 보낼 알림을 모은 뒤 삭제
         class_members = ClassMember.query.filter_by(class_id=class_id).all()
         for mem in class_members:
             if mem.user_id != by_user_id:
-                NotificationService.send_notification(
-                    mem.user_id,
-                    "CLASS_DISSOLVED",
-                    f"[{clazz.name}] 클래스가 해체되었습니다.",
-                    related_id=class_id
-                )
+                notifications.append({
+                    "user_id": mem.user_id,
+                    "type": "CLASS_DISSOLVED",
+                    "message": f"[{clazz.name}] 클래스가 해체되었습니다.",
+                    "related_id": class_id,
+                })
             db.session.delete(mem)
 
-        # 5. 클래스 자체 삭제
+        # 5. 클래스 자체 삭제 후 알림과 함께 한 번에 커밋
         db.session.delete(clazz)
-        db.session.commit()
\ No newline at end of file
+        NotificationService.enqueue(notifications)
+        db.session.commit()
+
+        # 6. 클래스 이름(팀 라벨) 캐시 제거
+        from services.team_service import TeamService
+        TeamService.invalidate_label(class_id=class_id)
\ No newline at end of file
@@ -0,0 +1,222 @@
+"""
+매칭 작업 큐를 관리하는 서비스 레이어입니다.
+
+``MatchingRequest``를 영속적인 작업 큐로 사용합니다. 웹 요청은 작업을 등록하고
+미리 계산된 결과만 조회하며, 실제 후보자 점수 계산은 ``worker.py``의
+백그라운드 워커가 수행해 ``MatchingResult``에 저장합니다.
+
+저장된 결과는 계산 당시의 ``team_version``을 기록합니다. 팀 정보가 수정되면
+팀 버전이 올라가고, 후보 풀이 바뀌면(프로필 수정, 클래스 가입) 해당 팀들의
+``team_version``을 비워 결과가 오래되었음을 표시합니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import joinedload
+
+from config import Config
+from database import db
+from models.class_member import ClassMember
+from models.matching_request import MatchingRequest
+from models.matching_result import MatchingResult
+from models.team import Team
+from models.team_member import TeamMember
+from services.matching_service import MatchingService
+
+
+class MatchingJobService:
+    """Queues candidate ranking jobs and serves their stored results."""
+
+    # =================================
+    # 작업 등록 / 조회
+    # =================================
+    @staticmethod
+    def enqueue(team_id: int, requested_by: Optional[int] = None) -> MatchingRequest:
+        """Queue a ranking job for a team unless one is already waiting or running."""
+        active = MatchingJobService.active_request(team_id)
+        if active:
+            return active
+        job = MatchingRequest(team_id=team_id, requested_by=requested_by, status="PENDING")
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    @staticmethod
+    def active_request(team_id: int) -> Optional[MatchingRequest]:
+        """Return the team's PENDING or RUNNING job, if any."""
+        return (
+            MatchingRequest.query
+            .filter(MatchingRequest.team_id == team_id, MatchingRequest.status.in_(("PENDING", "RUNNING")))
+            .order_by(MatchingRequest.id)
+            .first()
+        )
+
+    @staticmethod
+    def latest_done(team_id: int) -> Optional[MatchingRequest]:
+        """Return the team's most recently completed job."""
+        return (
+            MatchingRequest.query
+            .filter_by(team_id=team_id, status="DONE")
+            .order_by(MatchingRequest.id.desc())
+            .first()
+        )
+
+    @staticmethod
+    def is_outdated(job: Optional[MatchingRequest], team: Team) -> bool:
+        """Return whether ``job`` is missing or was computed from older team or candidate data."""
+        return job is None or job.team_version != team.version
+
+    @staticmethod
+    def get_results(job: MatchingRequest, limit: int, offset: int = 0) -> Tuple[List[Tuple[object, int]], bool]:
+        """Return one page of ``(user, score)`` in rank order and whether more rows exist.
+
+        Users who joined the team after the job ran are left out.
+        """
+        member_ids = db.session.query(TeamMember.user_id).filter(TeamMember.team_id == job.team_id)
+        rows = (
+            MatchingResult.query
+            .options(joinedload(MatchingResult.user))
+            .filter(MatchingResult.request_id == job.id, ~MatchingResult.user_id.in_(member_ids))
+            .order_by(MatchingResult.rank)
+            .offset(offset)
+            .limit(limit + 1)
+            .all()
+        )
+        return [(r.user, r.score) for r in rows[:limit]], len(rows) > limit
+
+    # =================================
+    # 워커 처리
+    # =================================
+    @staticmethod
+    def claim_next() -> Optional[MatchingRequest]:
+        """Atomically move the oldest PENDING job to RUNNING and return it."""
+        while True:
+            job = (
+                MatchingRequest.query
+                .filter_by(status="PENDING")
+                .order_by(MatchingRequest.id)
+                .first()
+            )
+            if not job:
+                return None
+            # 다른 워커가 먼저 가져간 경우 다음 작업을 시도
+            claimed = (
+                MatchingRequest.query
+                .filter_by(id=job.id, status="PENDING")
+                .update({"status": "RUNNING", "started_at": db.func.now()}, synchronize_session=False)
+            )
+            db.session.commit()
+            if claimed:
+                return MatchingRequest.query.get(job.id)
+
+    @staticmethod
+    def process(job: MatchingRequest) -> None:
+        """Rank the team's candidates, store the results and mark the job DONE."""
+        team = Team.query.get(job.team_id)
+        if not team:
+            job.status = "FAILED"
+            job.error = "존재하지 않는 팀입니다."
+            job.finished_at = db.func.now()
+            db.session.commit()
+            return
+
+        try:
+            # 화면은 저장된 순위를 SQL로 한 페이지씩 읽으므로, 여기서는 상위 후보만 골라 저장
+            candidates = MatchingService.find_candidates(team)
+            scored = MatchingService.match_candidates(
+                candidates, team, limit=Config.MATCHING_RESULT_LIMIT or None
+            )
+            rows = [
+                {"request_id": job.id, "team_id": team.id, "user_id": user.id, "score": score, "rank": rank}
+                for rank, (user, score) in enumerate(scored, start=1)
+            ]
+            # 이전 결과는 새 결과로 대체 (다시 대기시킨 작업이 두 번 실행된 경우도 포함)
+            MatchingResult.query.filter(MatchingResult.team_id == team.id).delete(synchronize_session=False)
+            if rows:
+                db.session.execute(db.insert(MatchingResult), rows)
+            job.team_version = team.version
+            job.status = "DONE"
+            job.finished_at = db.func.now()
+            db.session.commit()
+        except Exception as exc:
+            db.session.rollback()
+            job.status = "FAILED"
+            job.error = str(exc)[:255]
+            job.finished_at = db.func.now()
+            db.session.commit()
+
+    @staticmethod
+    def run_pending(max_jobs: Optional[int] = None) -> int:
+        """Process queued jobs until the queue is empty (or ``max_jobs``); return the count."""
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            job = MatchingJobService.claim_next()
+            if not job:
+                break
+            MatchingJobService.process(job)
+            processed += 1
+        return processed
+
+    @staticmethod
+    def requeue_stale(now: Optional[datetime] = None) -> int:
+        """Move jobs RUNNING for longer than ``MATCHING_JOB_TIMEOUT`` back to PENDING.
+
+        A worker that stopped mid-job leaves its job RUNNING, which also keeps
+        ``enqueue`` from queueing a new one for that team. Returns the number
+        of jobs requeued.
+        """
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=Config.MATCHING_JOB_TIMEOUT)
+        requeued = (
+            MatchingRequest.query
+            .filter(MatchingRequest.status == "RUNNING", MatchingRequest.started_at < cutoff)
+            .update({"status": "PENDING", "started_at": None}, synchronize_session=False)
+        )
+        db.session.commit()
+        return requeued
+
+    # =================================
+    # 결과 무효화
+    # =================================
+    @staticmethod
+    def mark_outdated(team_ids) -> None:
+        """Flag the finished results of ``team_ids`` (a list or subquery) as outdated. The caller commits.
+
+        The stored ranking stays visible until a new job replaces it.
+        """
+        MatchingRequest.query.filter(
+            MatchingRequest.status == "DONE",
+            MatchingRequest.team_version.isnot(None),
+            MatchingRequest.team_id.in_(team_ids),
+        ).update({"team_version": None}, synchronize_session=False)
+
+    @staticmethod
+    def mark_outdated_for_user(user_id: int) -> None:
+        """Flag results of every team the user can be a candidate for. The caller commits."""
+        # 클래스 팀은 같은 클래스 멤버만, 클래스가 없는 팀은 모든 사용자가 후보
+        class_ids = db.session.query(ClassMember.class_id).filter(ClassMember.user_id == user_id)
+        MatchingJobService.mark_outdated(
+            db.session.query(Team.id).filter(db.or_(Team.class_id.is_(None), Team.class_id.in_(class_ids)))
+        )
+
+    @staticmethod
+    def mark_outdated_for_class(class_id: int) -> None:
+        """Flag results of every team in a class after its members changed. The caller commits."""
+        MatchingJobService.mark_outdated(db.session.query(Team.id).filter(Team.class_id == class_id))
+
+    # =================================
+    # 정리
+    # =================================
+    @staticmethod
+    def purge_team(team_id: int) -> None:
+        """Delete a team's jobs and results. The caller commits."""
+        MatchingResult.query.filter_by(team_id=team_id).delete(synchronize_session=False)
+        MatchingRequest.query.filter_by(team_id=team_id).delete(synchronize_session=False)
+
+    @staticmethod
+    def purge_user(user_id: int) -> None:
+        """Delete stored results that list a user. The caller commits."""
+        MatchingResult.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+        MatchingRequest.query.filter_by(requested_by=user_id).update(
+            {"requested_by": None}, synchronize_session=False
+        )
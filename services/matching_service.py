@@ -3,13 +3,93 @@
 간단한 매칭 점수를 계산하고, 후보자를 점수 내림차순으로 반환하는 서비스입니다.
 필요시 클래스나 카테고리 기반 후보자 필터링도 지원합니다.
 
+후보자가 많을 때는 팀 요구사항을 한 번만 토큰화한 뒤, 후보자의 기술/목표를
+팀 어휘(vocabulary)에 대한 비트셋으로 인코딩해 한 번에 점수를 계산합니다.
 """
 
-from typing import List, Tuple
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+from sqlalchemy.orm import joinedload
+
+from config import Config
+from database import db
 from models.user import User
 from models.profile import Profile
 from models.team import Team
+from models.team_member import TeamMember
+from models.class_member import ClassMember
+from services.tag_service import TagService
+
+
+class TeamVector(NamedTuple):
+    """팀 요구사항을 한 번만 토큰화해 둔 결과입니다.
+
+    ``skill_vocab``/``goal_vocab``은 토큰을 비트 위치로 매핑하며,
+    후보자의 토큰은 이 어휘에 대한 비트셋으로 인코딩됩니다.
+    """
+
+    skill_vocab: Dict[str, int]
+    goal_vocab: Dict[str, int]
+    goal_text: Optional[str]
+
+
+def _split_csv(value: str) -> List[str]:
+    """쉼표로 구분된 문자열을 공백 제거/소문자 토큰 목록으로 변환합니다."""
+    return [x.strip().lower() for x in value.split(",")]
+
+
+def _build_vocab(tokens) -> Dict[str, int]:
+    vocab: Dict[str, int] = {}
+    for token in tokens:
+        vocab.setdefault(token, 1 << len(vocab))
+    return vocab
+
+
+def _encode(tokens, vocab: Dict[str, int]) -> int:
+    """토큰 목록을 어휘에 대한 비트셋(int)으로 인코딩합니다. 어휘 밖 토큰은 무시됩니다."""
+    mask = 0
+    for token in tokens:
+        mask |= vocab.get(token, 0)
+    return mask
+
+
+def encode_team(required_skills: Optional[str], goal: Optional[str]) -> TeamVector:
+    """팀의 필요 기술과 목표를 한 번만 토큰화합니다."""
+    skill_vocab = _build_vocab(_split_csv(required_skills)) if required_skills else {}
+    goal_vocab = _build_vocab(x.strip().lower() for x in goal.split()) if goal else {}
+    return TeamVector(skill_vocab, goal_vocab, goal.lower() if goal else None)
+
+
+def score_profile(
+    vector: TeamVector,
+    skills: Optional[str],
+    personality: Optional[str],
+    goals: Optional[str],
+) -> int:
+    """인코딩된 팀에 대해 프로필 문자열의 점수를 계산합니다.
+
+    ``MatchingService.calculate_score``와 동일한 규칙을 따릅니다.
+    """
+    score = 0
+    if skills and vector.skill_vocab:
+        score += _encode(_split_csv(skills), vector.skill_vocab).bit_count() * 2
+    if personality and vector.goal_text is not None:
+        if personality.strip().lower() in vector.goal_text:
+            score += 1
+    if goals and vector.goal_text is not None:
+        score += _encode(_split_csv(goals), vector.goal_vocab).bit_count()
+    return score
+
+
+ProfileFields = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def _score_chunk(vectors: List[TeamVector], profiles: List[ProfileFields]) -> List[List[int]]:
+    """프로세스 풀에서 실행되는 작업 단위: 프로필 묶음 × 전체 팀 점수 행렬을 계산합니다."""
+    return [[score_profile(vector, *fields) for vector in vectors] for fields in profiles]
 
 
 class MatchingService:
@@ -43,17 +123,99 @@ class MatchingService:
 
         return score
 
+    @staticmethod
+    def find_candidates(team: Team) -> list[User]:
+        """Return non-member users sharing at least one skill, goal or personality token with the team.
+
+        Candidates are looked up through the ``UserTag`` inverted index, so the
+        cost grows with the number of overlapping users rather than the size
+        of the user table. A personality earns the score bonus when it appears
+        in the team goal; it is found here when it is one of the goal's words.
+        When the team belongs to a class, only members of that class are returned.
+        """
+        user_ids = TagService.user_ids_matching(
+            TagService.tokenize_csv(team.required_skills),
+            TagService.tokenize_words(team.goal),
+        )
+        if user_ids is None:
+            return []
+
+        member_ids = db.session.query(TeamMember.user_id).filter(TeamMember.team_id == team.id)
+        query = (
+            User.query
+            .options(joinedload(User.profile))
+            .filter(User.id.in_(user_ids))
+            .filter(~User.id.in_(member_ids))
+        )
+        if team.class_id:
+            query = query.join(ClassMember, ClassMember.user_id == User.id).filter(
+                ClassMember.class_id == team.class_id
+            )
+        return query.all()
+
+    @staticmethod
+    def score_candidates(candidates: list[User], team: Team) -> list[int]:
+        """Score a whole candidate pool against one team in a single pass.
+
+        Returns scores in the same order as ``candidates``; each score equals
+        ``calculate_score(candidate, team)``.
+        """
+        vector = None
+
+        # 같은 프로필 문자열은 후보자가 많아도 한 번만 인코딩합니다.
+        memo: Dict[Tuple[Optional[str], Optional[str], Optional[str]], int] = {}
+        scores = []
+        for candidate in candidates:
+            profile: Profile = candidate.profile
+            if not profile:
+                scores.append(0)
+                continue
+            key = (profile.skills, profile.personality, profile.goals)
+            score = memo.get(key)
+            if score is None:
+                if vector is None:
+                    vector = encode_team(team.required_skills, team.goal)
+                score = memo[key] = score_profile(vector, *key)
+            scores.append(score)
+        return scores
+
+    @staticmethod
+    def score_matrix(profiles: List[ProfileFields], teams: list[Team]) -> List[List[int]]:
+        """Return ``matrix[i][j]``, the score of profile ``i`` (skills, personality, goals) for team ``j``.
+
+        Large matrices are split into chunks and scored on a process pool.
+        """
+        vectors = [encode_team(t.required_skills, t.goal) for t in teams]
+        if len(profiles) * len(vectors) < Config.AUTO_FORM_PARALLEL_THRESHOLD:
+            return _score_chunk(vectors, profiles)
+
+        workers = Config.AUTO_FORM_WORKERS or os.cpu_count() or 1
+        chunk_size = max(1, -(-len(profiles) // (workers * 4)))
+        chunks = [profiles[i:i + chunk_size] for i in range(0, len(profiles), chunk_size)]
+        matrix: List[List[int]] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for rows in pool.map(_score_chunk, [vectors] * len(chunks), chunks):
+                matrix.extend(rows)
+        return matrix
 
     @staticmethod
     def match_candidates(
         candidates: list[User], 
         team: Team, 
         filter_class: bool = False, 
-        filter_category: bool = False
+        filter_category: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> list[tuple[User, int]]:
-        """Return candidates sorted by matching score (descending)."""
-    
-        scored = []
+        """Return candidates sorted by matching score (descending).
+
+        When ``limit`` is given only the ``offset``..``offset + limit`` slice of
+        the ranking is returned, selected with a bounded heap instead of a
+        full sort. Ties keep the candidates' original order either way.
+        The matching worker uses this to store only the top
+        ``MATCHING_RESULT_LIMIT`` candidates; pages are then read from the
+        stored ranking with SQL ``OFFSET``/``LIMIT``.
+        """
 
         # 1. 후보자 필터링
         if filter_class and team.class_id:  # 팀이 클래스에 속해 있다면
@@ -68,11 +230,18 @@ class MatchingService:
                 if getattr(c, 'category_id', None) == team.category_id
             ]
 
-        # 2. 점수 계산
-        for candidate in candidates:
-            score = MatchingService.calculate_score(candidate, team)
-            scored.append((candidate, score))
+        # 2. 점수 계산 (팀 토큰화는 한 번만 수행)
+        scores = MatchingService.score_candidates(candidates, team)
+
+        # 3. 내림차순 정렬 (limit이 있으면 상위 offset + limit개만 힙으로 선택)
+        if limit is not None:
+            top = heapq.nlargest(
+                offset + limit,
+                range(len(candidates)),
+                key=lambda i: (scores[i], -i),
+            )
+            return [(candidates[i], scores[i]) for i in top[offset:]]
 
-        # 3. 내림차순 정렬
+        scored = list(zip(candidates, scores))
         scored.sort(key=lambda x: x[1], reverse=True)
         return scored
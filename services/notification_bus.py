@@ -0,0 +1,74 @@
+"""
+실시간 알림 전달을 위한 프로세스 내 발행/구독 버스입니다.
+
+``/notifications/stream`` SSE 연결마다 사용자별 대기 큐를 하나 등록하고,
+알림이 커밋되면 해당 사용자의 큐를 깨웁니다. 큐에는 "새 알림이 있다"는
+신호만 들어가며, 실제 알림 내용은 스트림이 데이터베이스에서 다시 읽으므로
+커밋되지 않은 알림이 전달되는 일은 없습니다.
+
+다른 프로세스(``worker.py`` 등)에서 만든 알림은 이 버스를 거치지 않으므로,
+스트림은 신호가 없어도 일정 주기마다 데이터베이스를 확인해 전달합니다.
+"""
+
+import queue
+import threading
+from typing import Dict, Iterable, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database import db
+
+# 커밋 후 깨울 사용자 ID를 세션에 모아 두는 키
+_PENDING_KEY = "notification_bus_users"
+
+_lock = threading.Lock()
+_subscribers: Dict[int, Set[queue.Queue]] = {}
+
+
+def subscribe(user_id: int) -> queue.Queue:
+    """Register a wake-up queue for one stream connection of ``user_id``."""
+    # 크기 1 큐: 처리 전에 여러 번 깨워도 신호 하나로 합쳐짐
+    waiter: queue.Queue = queue.Queue(maxsize=1)
+    with _lock:
+        _subscribers.setdefault(user_id, set()).add(waiter)
+    return waiter
+
+
+def unsubscribe(user_id: int, waiter: queue.Queue) -> None:
+    """Remove a queue registered with :func:`subscribe`."""
+    with _lock:
+        waiters = _subscribers.get(user_id)
+        if waiters is None:
+            return
+        waiters.discard(waiter)
+        if not waiters:
+            del _subscribers[user_id]
+
+
+def publish(user_ids: Iterable[int]) -> None:
+    """Wake every stream connected for the given users."""
+    with _lock:
+        waiters = [w for uid in set(user_ids) for w in _subscribers.get(uid, ())]
+    for waiter in waiters:
+        try:
+            waiter.put_nowait(None)
+        except queue.Full:
+            pass
+
+
+def publish_after_commit(user_ids: Iterable[int]) -> None:
+    """Wake the users' streams once the current transaction commits."""
+    db.session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        publish(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,145 @@
+"""
+알림 보존 정책을 적용하는 서비스 레이어입니다.
+
+``notifications`` 테이블이 계속 커지지 않도록 백그라운드 워커가 주기적으로
+읽은 알림을 정리합니다. 정리 대상은 다음과 같습니다.
+
+- 보존 기간(``NOTIFICATION_RETENTION_DAYS``)이 지난 읽은 알림
+- 팀이 해체되어 더 이상 가리킬 팀이 없는 읽은 팀 알림
+- 사용자별 최근 ``NOTIFICATION_MAX_PER_USER``개를 넘는 오래된 읽은 알림
+
+대상은 정해진 크기의 배치 단위로 보관 테이블로 옮기거나 삭제하며,
+배치마다 커밋하므로 한 번에 오래 쓰기 잠금을 잡지 않습니다.
+읽지 않은 알림은 건드리지 않으므로 읽지 않은 알림 카운터는 바뀌지 않습니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import Config
+from database import db
+from models.notification import Notification
+from models.notification_archive import NotificationArchive
+from models.team import Team
+
+# related_id가 팀 ID를 가리키는 알림 종류
+TEAM_NOTIFICATION_TYPES = (
+    "APPLICATION",
+    "TEAM_DISSOLVED",
+    "REMOVED",
+    "WITHDRAWAL",
+    "DELEGATED",
+    "APPLICATION_ACCEPTED",
+    "APPLICATION_REJECTED",
+)
+
+# 보관 테이블로 복사할 컬럼 (원본 id는 original_id로 복사)
+_ARCHIVED_COLUMNS = ("user_id", "type", "message", "related_id", "created_at", "read_at", "count")
+
+
+class NotificationRetentionService:
+    """Archives or deletes old read notifications in bounded batches."""
+
+    @staticmethod
+    def run(now: Optional[datetime] = None) -> Dict[str, int]:
+        """Apply every retention rule and return how many rows each one removed.
+
+        Stops after ``NOTIFICATION_RETENTION_MAX_BATCHES`` batches in total;
+        whatever is left is handled on the next scheduled run.
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=Config.NOTIFICATION_RETENTION_DAYS)
+        read = Notification.read_at.isnot(None)
+        team_ids = db.session.query(Team.id)
+
+        rules = {
+            "expired": lambda limit: NotificationRetentionService._select_ids(
+                limit, read, Notification.created_at < cutoff
+            ),
+            "orphaned": lambda limit: NotificationRetentionService._select_ids(
+                limit,
+                read,
+                Notification.type.in_(TEAM_NOTIFICATION_TYPES),
+                Notification.related_id.isnot(None),
+                ~Notification.related_id.in_(team_ids),
+            ),
+            "over_cap": NotificationRetentionService._select_over_cap,
+        }
+
+        removed = {name: 0 for name in rules}
+        budget = Config.NOTIFICATION_RETENTION_MAX_BATCHES
+        for name, select_ids in rules.items():
+            while budget > 0:
+                ids = select_ids(Config.NOTIFICATION_RETENTION_BATCH)
+                if not ids:
+                    break
+                budget -= 1
+                removed[name] += NotificationRetentionService._remove(ids)
+                if len(ids) < Config.NOTIFICATION_RETENTION_BATCH:
+                    break
+        return removed
+
+    @staticmethod
+    def _select_ids(limit: int, *criteria) -> List[int]:
+        rows = (
+            db.session.query(Notification.id)
+            .filter(*criteria)
+            .order_by(Notification.id)
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    @staticmethod
+    def _select_over_cap(limit: int) -> List[int]:
+        """Pick read notifications older than each user's newest ``NOTIFICATION_MAX_PER_USER``."""
+        cap = Config.NOTIFICATION_MAX_PER_USER
+        # 1. 한도를 넘은 사용자만 대상으로 순위 계산
+        heavy_users = (
+            db.session.query(Notification.user_id)
+            .group_by(Notification.user_id)
+            .having(db.func.count(Notification.id) > cap)
+        )
+        ranked = (
+            db.session.query(
+                Notification.id.label("id"),
+                Notification.read_at.label("read_at"),
+                db.func.row_number()
+                .over(
+                    partition_by=Notification.user_id,
+                    order_by=(Notification.created_at.desc(), Notification.id.desc()),
+                )
+                .label("position"),
+            )
+            .filter(Notification.user_id.in_(heavy_users))
+            .subquery()
+        )
+        # 2. 최근 cap개 밖에 있는 읽은 알림만 선택
+        rows = (
+            db.session.query(ranked.c.id)
+            .filter(ranked.c.position > cap, ranked.c.read_at.isnot(None))
+            .order_by(ranked.c.id)
+            .limit(limit)
+            .all()
+        )
+        return [row.id for row in rows]
+
+    @staticmethod
+    def _remove(ids: List[int]) -> int:
+        """Move (or delete) one batch of notifications and commit."""
+        if Config.NOTIFICATION_ARCHIVE:
+            source = db.select(
+                Notification.id, *(getattr(Notification, c) for c in _ARCHIVED_COLUMNS)
+            ).where(Notification.id.in_(ids))
+            db.session.execute(
+                db.insert(NotificationArchive.__table__).from_select(
+                    ["original_id", *_ARCHIVED_COLUMNS], source
+                )
+            )
+        result = db.session.execute(
+            db.delete(Notification)
+            .where(Notification.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount
@@ -4,12 +4,84 @@
 사용자 알림을 생성하고 관리합니다. 이 단순 구현에서는
 알림을 데이터베이스에 기록하지만, 필요시 푸시 알림
 전송 기능으로 확장할 수 있습니다.
+알림을 만들거나 읽을 때 사용자별 읽지 않은 알림 카운터도 함께 갱신하며,
+카운터가 어긋나면 백그라운드 워커가 주기적으로 다시 맞춥니다.
+새 알림은 커밋 직후 ``notification_bus``를 통해 SSE 스트림에 전달됩니다.
+
+팀 지원/초대 처리 같은 업무 흐름은 ``enqueue``로 알림을 아웃박스에만 기록해
+업무 트랜잭션의 커밋 한 번에 함께 저장합니다. 백그라운드 워커가
+``dispatch_outbox``로 쌓인 알림을 배치 단위로 알림함과 외부 전송 채널
+(푸시/이메일 대용 로그 등)에 전달합니다.
+이때 같은 사용자에게 같은 종류·같은 대상으로 반복된 알림은 일정 시간 안이면
+읽지 않은 기존 알림 한 행으로 합쳐 "새 지원 3건"처럼 보여 줍니다.
 """
 
-from typing import Optional
+import logging
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+from config import Config
 from database import db
 from models.notification import Notification
+from models.notification_outbox import NotificationOutbox
+from models.team import Team
+from models.user import User
+from services import notification_bus
+
+logger = logging.getLogger(__name__)
+
+# 아웃박스 배치를 알림함에 넣은 뒤 호출되는 외부 전송 채널 목록 (푸시/이메일 연동 지점)
+_channels: List[Callable[[List[dict]], None]] = []
+
+
+def register_channel(channel: Callable[[List[dict]], None]) -> None:
+    """Add an external delivery channel called with each dispatched batch."""
+    _channels.append(channel)
+
+
+def _log_channel(batch: List[dict]) -> None:
+    """Stand-in for push/email delivery that only logs what would be sent."""
+    for n in batch:
+        logger.info("deliver notification to user %s: [%s] %s", n["user_id"], n["type"], n["message"])
+
+
+if Config.NOTIFICATION_LOG_DELIVERY:
+    register_channel(_log_channel)
+
+
+# 합쳐서 보낼 알림 종류와 합쳐졌을 때의 메시지.
+# {prefix}는 원래 메시지 앞의 "[팀 구분]", {team}은 related_id가 가리키는 팀 이름입니다.
+COALESCED_MESSAGES = {
+    "APPLICATION": "{prefix} {team}팀에 새 지원이 {count}건 도착했습니다.",
+    "WITHDRAWAL": "{prefix} {team}팀에서 {count}명이 탈퇴했습니다.",
+}
+
+_PREFIX = re.compile(r"^\[[^\]]*\]")
+
+
+def _normalize(notifications: Iterable[dict]) -> List[dict]:
+    return [
+        {
+            "user_id": n["user_id"],
+            "type": n["type"],
+            "message": n["message"],
+            "related_id": n.get("related_id"),
+            "count": n.get("count", 1),
+        }
+        for n in notifications
+    ]
+
+
+def _coalesced_message(type_: str, message: str, count: int, team_name: str = "") -> str:
+    """Return the summary message for ``count`` merged notifications of ``type_``."""
+    if count <= 1:
+        return message
+    match = _PREFIX.match(message)
+    return COALESCED_MESSAGES[type_].format(
+        prefix=match.group(0) if match else "", team=team_name, count=count
+    ).strip()
 
 
 class NotificationService:
@@ -26,20 +98,325 @@ class NotificationService:
             related_id=related_id,
         )
         db.session.add(notification)
+        NotificationService._adjust_unread({user_id: 1})
+        notification_bus.publish_after_commit([user_id])
         db.session.commit()
         return notification
 
+    @staticmethod
+    # 여러 알림 한 번에 보내기
+    def send_many(notifications: Iterable[dict], commit: bool = True) -> int:
+        """Insert many notifications with a single executemany INSERT.
+
+        Each item needs ``user_id``, ``type`` and ``message`` and may carry
+        ``related_id`` and ``count``. Pass ``commit=False`` to let the caller commit them
+        together with its own changes. Returns the number of rows inserted.
+        """
+        rows = _normalize(notifications)
+        if rows:
+            db.session.execute(db.insert(Notification), rows)
+            NotificationService._adjust_unread(Counter(row["user_id"] for row in rows))
+            notification_bus.publish_after_commit(row["user_id"] for row in rows)
+        if commit:
+            db.session.commit()
+        return len(rows)
+
+    @staticmethod
+    # 아웃박스에 알림 기록 (업무 트랜잭션과 함께 커밋)
+    def enqueue(notifications: Iterable[dict]) -> int:
+        """Write notifications to the outbox inside the caller's transaction.
+
+        Items use the same keys as ``send_many``. Nothing is committed here;
+        the rows become visible to the dispatcher when the caller commits.
+        Returns the number of rows written.
+        """
+        rows = _normalize(notifications)
+        if rows:
+            db.session.execute(db.insert(NotificationOutbox), rows)
+        return len(rows)
+
+    @staticmethod
+    # 아웃박스 배치 전달
+    def dispatch_outbox(batch_size: int = Config.NOTIFICATION_OUTBOX_BATCH) -> int:
+        """Deliver one batch of outbox rows to the inbox and external channels.
+
+        The inbox insert and the outbox delete share one transaction, so each
+        row reaches the inbox exactly once even with several dispatchers.
+        External channels run after the commit. Returns the rows delivered.
+        """
+        pending = (
+            NotificationOutbox.query
+            .order_by(NotificationOutbox.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not pending:
+            db.session.rollback()
+            return 0
+
+        ids = [row.id for row in pending]
+        batch = _normalize(
+            {"user_id": r.user_id, "type": r.type, "message": r.message, "related_id": r.related_id}
+            for r in pending
+        )
+        NotificationService._deliver_coalesced(batch)
+        claimed = db.session.execute(
+            db.delete(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        # 다른 디스패처가 일부를 먼저 전달했다면 이번 배치는 취소하고 다음에 다시 시도
+        if claimed != len(ids):
+            db.session.rollback()
+            return 0
+        db.session.commit()
+
+        for channel in _channels:
+            try:
+                channel(batch)
+            except Exception:  # 외부 전송 실패가 알림함 전달이나 다른 채널을 막지 않도록 함
+                logger.exception("notification channel %r failed", channel)
+        return len(batch)
+
+    @staticmethod
+    def _deliver_coalesced(batch: List[dict]) -> None:
+        """Insert a batch into the inbox, merging repeats of coalescible types.
+
+        Notifications sharing (user, type, related_id) are merged within the
+        batch, and then with the newest matching unread inbox row created within
+        ``NOTIFICATION_COALESCE_WINDOW`` seconds. That row is replaced by a new
+        one with the summed ``count`` and a summary message naming the team, so
+        the merge gets a new id and reaches open streams, while the unread
+        counter stays the same. Nothing is committed.
+        """
+        # 1. 배치 안에서 같은 키끼리 합치기 (마지막 메시지 기준, 순서 유지)
+        groups: Dict[tuple, dict] = {}
+        plain: List[dict] = []
+        for n in batch:
+            if n["type"] not in COALESCED_MESSAGES:
+                plain.append(n)
+                continue
+            key = (n["user_id"], n["type"], n["related_id"])
+            if key in groups:
+                merged = groups.pop(key)
+                n = dict(n, count=merged["count"] + n["count"])
+            groups[key] = n
+
+        keys = [key for key in groups if key[2] is not None]
+        team_names: Dict[int, str] = {}
+        claimed: Set[int] = set()
+        if keys:
+            # 2. 시간 창 안의 읽지 않은 기존 알림 중 키마다 가장 최근 행 찾기
+            cutoff = datetime.utcnow() - timedelta(seconds=Config.NOTIFICATION_COALESCE_WINDOW)
+            existing = (
+                db.session.query(
+                    Notification.id, Notification.user_id, Notification.type,
+                    Notification.related_id, Notification.count,
+                )
+                .filter(
+                    db.tuple_(Notification.user_id, Notification.type, Notification.related_id).in_(keys),
+                    Notification.read_at.is_(None),
+                    Notification.created_at >= cutoff,
+                )
+                .order_by(Notification.id)
+                .all()
+            )
+            latest = {(row.user_id, row.type, row.related_id): row for row in existing}
+
+            # 3. 찾은 행을 읽음 처리해 선점 (그 사이에 읽음 처리된 행은 합치지 않음)
+            if latest:
+                claimed = set(
+                    db.session.execute(
+                        db.update(Notification)
+                        .where(
+                            Notification.id.in_([row.id for row in latest.values()]),
+                            Notification.read_at.is_(None),
+                        )
+                        .values(read_at=db.func.now())
+                        .returning(Notification.id)
+                        .execution_options(synchronize_session=False)
+                    ).scalars()
+                )
+                claimed_users: Counter = Counter()
+                for key, row in latest.items():
+                    if row.id in claimed:
+                        groups[key] = dict(groups[key], count=row.count + groups[key]["count"])
+                        claimed_users[row.user_id] += 1
+                NotificationService._adjust_unread({uid: -n for uid, n in claimed_users.items()})
+
+            if any(n["count"] > 1 for n in groups.values()):
+                team_ids = {key[2] for key in keys}
+                team_names = dict(db.session.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all())
+
+        # 4. 알림함에 추가 (합쳐진 경우 요약 메시지 사용)
+        fresh = plain + [
+            dict(
+                n,
+                message=_coalesced_message(
+                    n["type"], n["message"], n["count"], team_names.get(n["related_id"], "")
+                ),
+            )
+            for n in groups.values()
+        ]
+        NotificationService.send_many(fresh, commit=False)
+
+        # 5. 합쳐진 기존 행 삭제 (새 행을 먼저 넣어 새 행이 항상 더 큰 ID를 받도록 함)
+        if claimed:
+            db.session.execute(
+                db.delete(Notification)
+                .where(Notification.id.in_(claimed))
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, notification_id: int) -> str:
+        return f"{created_at.isoformat()}_{notification_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+        """Parse a ``createdat_id`` cursor; invalid values start from the first page."""
+        if not cursor:
+            return None
+        try:
+            created_at, notification_id = cursor.rsplit("_", 1)
+            return datetime.fromisoformat(created_at), int(notification_id)
+        except ValueError:
+            return None
+
+    @staticmethod
+    # 알림함 한 페이지 조회
+    def list_for_user(
+        user_id: int,
+        limit: int,
+        before: Optional[Tuple[datetime, int]] = None,
+        unread_only: bool = False,
+    ) -> Tuple[List[Notification], Optional[Tuple[datetime, int]]]:
+        """Return one page of a user's notifications, newest first.
+
+        Rows are ordered by (``created_at``, ``id``) descending. ``before`` is
+        the (``created_at``, ``id``) of the last notification of the previous
+        page, so the next page is found even if that row has since been merged
+        or deleted. Also returns the cursor of the next page, or ``None`` on
+        the last page.
+        """
+        query = Notification.query.filter(Notification.user_id == user_id)
+        if unread_only:
+            query = query.filter(Notification.read_at.is_(None))
+        if before is not None:
+            last_created, last_id = before
+            query = query.filter(
+                db.or_(
+                    Notification.created_at < last_created,
+                    db.and_(Notification.created_at == last_created, Notification.id < last_id),
+                )
+            )
+        rows = (
+            query.order_by(Notification.created_at.desc(), Notification.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        page = rows[:limit]
+        next_cursor = (page[-1].created_at, page[-1].id) if len(rows) > limit else None
+        return page, next_cursor
+
+    @staticmethod
+    # 스트림으로 보낼 새 알림 조회
+    def list_since(user_id: int, after_id: int, limit: int = 50) -> List[Notification]:
+        """Return the user's notifications with ``id > after_id``, oldest first."""
+        return (
+            Notification.query.filter(Notification.user_id == user_id, Notification.id > after_id)
+            .order_by(Notification.id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def latest_id(user_id: int) -> int:
+        """Return the id of the user's newest notification, or 0 if there is none."""
+        return db.session.query(db.func.max(Notification.id)).filter(Notification.user_id == user_id).scalar() or 0
+
     @staticmethod
     # 읽음 처리
     def mark_as_read(notification_id: int, user_id: int) -> None:
         """Mark a notification as read if it belongs to the user."""
-        notification = Notification.query.get(notification_id)
-        # 1. 유효성 및 권한 검사
-        if not notification or notification.user_id != user_id:
-            return
-        # 2. 중복 처리 방지
-        if notification.read_at:
+        # 사용자 본인의 읽지 않은 알림일 때만 UPDATE 한 번으로 처리
+        NotificationService._mark_read(user_id, Notification.id == notification_id)
+
+    @staticmethod
+    # 전체/종류별/대상별 일괄 읽음 처리
+    def mark_all_read(user_id: int, type: Optional[str] = None, related_id: Optional[int] = None) -> int:
+        """Mark every unread notification of the user read in one UPDATE.
+
+        ``type`` and ``related_id`` narrow the update to one kind of
+        notification or to the notifications about one team/invitation.
+        Returns the number of notifications marked read.
+        """
+        criteria = []
+        if type is not None:
+            criteria.append(Notification.type == type)
+        if related_id is not None:
+            criteria.append(Notification.related_id == related_id)
+        return NotificationService._mark_read(user_id, *criteria)
+
+    @staticmethod
+    def _mark_read(user_id: int, *criteria) -> int:
+        """Set ``read_at`` on the user's unread notifications matching ``criteria`` and commit."""
+        result = db.session.execute(
+            db.update(Notification)
+            .where(Notification.user_id == user_id, Notification.read_at.is_(None), *criteria)
+            .values(read_at=db.func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            NotificationService._adjust_unread({user_id: -result.rowcount})
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    # 읽지 않은 알림 수 (배지용)
+    def unread_count(user_id: int) -> int:
+        """Return the maintained unread counter with a single primary-key read."""
+        return db.session.query(User.unread_notification_count).filter(User.id == user_id).scalar() or 0
+
+    @staticmethod
+    # 읽지 않은 알림 카운터 재계산
+    def reconcile_unread_counts() -> int:
+        """Recompute every drifted unread counter from ``notifications``.
+
+        Runs as one UPDATE that only touches users whose stored counter
+        differs from the actual count. Returns the number of users fixed.
+        """
+        users = User.__table__
+        actual = (
+            db.select(db.func.count(Notification.id))
+            .where(Notification.user_id == users.c.id, Notification.read_at.is_(None))
+            .scalar_subquery()
+        )
+        result = db.session.execute(
+            db.update(users)
+            .where(users.c.unread_notification_count != actual)
+            .values(unread_notification_count=actual)
+        )
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _adjust_unread(deltas: Dict[int, int]) -> None:
+        """Add ``deltas`` to each user's unread counter (never below zero), uncommitted."""
+        params = [{"uid": uid, "delta": delta} for uid, delta in deltas.items() if delta]
+        if not params:
             return
-        # 3. 읽은 시간을 서버 시간으로 업데이트
-        notification.read_at = db.func.now()
-        db.session.commit()
\ No newline at end of file
+        users = User.__table__
+        counter = users.c.unread_notification_count
+        db.session.execute(
+            db.update(users)
+            .where(users.c.id == db.bindparam("uid"))
+            .values(
+                unread_notification_count=db.case(
+                    (counter + db.bindparam("delta") < 0, 0),
+                    else_=counter + db.bindparam("delta"),
+                )
+            ),
+            params,
+        )
\ No newline at end of file
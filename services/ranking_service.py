@@ -0,0 +1,202 @@
+"""
+팀 목록의 '매칭 점수순' 정렬을 담당하는 서비스 레이어입니다.
+
+사용자 태그와 팀 필요 기술 태그의 일치 개수를 집계 SQL 쿼리로 계산해
+프로필/팀 버전과 함께 캐시하고, (점수, 팀 ID) 기준 커서로 한 페이지만 조회합니다.
+클래스 상세와 카테고리 상세 화면이 같은 로직을 공유하며,
+사용자에게 맞는 팀을 클래스/카테고리 전체에서 추천하는 기능도 제공합니다.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import selectinload
+
+from config import Config
+from database import db
+from models.profile import Profile
+from models.team import Team
+from models.team_member import TeamMember
+from models.team_tag import TeamTag
+from models.user_tag import UserTag
+from services.tag_service import TagService
+from utils.cache import ScoreCache
+
+
+# '매칭 점수순' 정렬 점수 캐시: (팀, 사용자) → 점수, 프로필/팀 버전으로 최신 여부 확인
+_score_cache = ScoreCache(Config.MATCH_SCORE_CACHE_SIZE)
+
+
+class RankingService:
+    """Ranks teams for a user by tag overlap inside the database."""
+
+    @staticmethod
+    def encode_cursor(score: int, team_id: int) -> str:
+        return f"{score}_{team_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Parse a ``score_teamid`` cursor; invalid values start from the first page."""
+        if not cursor:
+            return None
+        try:
+            score, team_id = cursor.split("_", 1)
+            return int(score), int(team_id)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def rank_teams(
+        user_id: int,
+        class_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        limit: int = 20,
+        after: Optional[Tuple[int, int]] = None,
+        filters: Sequence = (),
+    ) -> Tuple[List[Tuple[Team, int]], Optional[Tuple[int, int]]]:
+        """Return one page of ``(team, score)`` ordered by score, then id, descending.
+
+        The score counts the user's tags (skills, goals, personality) found in
+        the team's required skills. ``after`` is the (score, team_id) of the
+        last row of the previous page. ``filters`` are extra criteria on
+        ``Team`` such as ``TeamService.listing_filters``. Also returns the
+        cursor of the next page, or None on the last page.
+
+        Scores are cached per (team, user) together with the profile and team
+        versions, so repeat views only read the ids and versions of the teams
+        in scope and aggregate tags for teams that are new or were edited.
+        """
+        scope = list(filters)
+        if class_id is not None:
+            scope.append(Team.class_id == class_id)
+        if category_id is not None:
+            scope.append(Team.category_id == category_id)
+
+        # 1. 범위 내 팀과 버전 조회 (필터는 매번 최신 값으로 적용)
+        profile_version = (
+            db.session.query(Profile.version).filter(Profile.user_id == user_id).scalar()
+        )
+        teams = db.session.query(Team.id, Team.version).filter(*scope).all()
+
+        # 2. 캐시에 없거나 버전이 바뀐 팀만 태그 일치 개수 집계
+        scores: Dict[int, int] = {}
+        missing = []
+        for team_id, team_version in teams:
+            cached = _score_cache.get(team_id, user_id, (profile_version, team_version))
+            if cached is None:
+                missing.append((team_id, team_version))
+            else:
+                scores[team_id] = cached
+        if missing:
+            # 캐시가 비어 있으면 범위 조건 그대로, 일부만 없으면 해당 팀 ID로 한정해 집계
+            if len(missing) == len(teams):
+                criteria = scope
+            else:
+                criteria = [Team.id.in_([team_id for team_id, _ in missing])]
+            computed = RankingService._overlap_scores(user_id, criteria)
+            for team_id, team_version in missing:
+                score = computed.get(team_id, 0)
+                _score_cache.put(team_id, user_id, (profile_version, team_version), score)
+                scores[team_id] = score
+
+        # 3. (점수, 팀 ID) 내림차순으로 커서 이후 한 페이지만 선택
+        ranked = ((score, team_id) for team_id, score in scores.items())
+        if after is not None:
+            ranked = (key for key in ranked if key < tuple(after))
+        top = heapq.nlargest(limit + 1, ranked)
+        page_ids = [team_id for _, team_id in top[:limit]]
+        by_id = {team.id: team for team in Team.query.filter(Team.id.in_(page_ids))}
+
+        page = [(by_id[team_id], score) for score, team_id in top[:limit]]
+        next_cursor = None
+        if len(top) > limit:
+            last_team, last_score = page[-1]
+            next_cursor = (last_score, last_team.id)
+        return page, next_cursor
+
+    @staticmethod
+    def _overlap_scores(user_id: int, criteria: Sequence) -> Dict[int, int]:
+        """Return {team_id: number of the user's tags in its required skills} for matching teams.
+
+        Teams without any shared tag are left out.
+        """
+        rows = (
+            db.session.query(TeamTag.team_id, db.func.count(db.distinct(TeamTag.tag)))
+            .join(UserTag, UserTag.tag == TeamTag.tag)
+            .join(Team, Team.id == TeamTag.team_id)
+            .filter(UserTag.user_id == user_id, TeamTag.kind == TagService.SKILL, *criteria)
+            .group_by(TeamTag.team_id)
+            .all()
+        )
+        return dict(rows)
+
+    # =================================
+    # 점수 캐시 관리
+    # =================================
+    @staticmethod
+    def forget_user(user_id: int) -> None:
+        """Drop cached scores of a user, e.g. before the account is deleted."""
+        _score_cache.invalidate_user(user_id)
+
+    @staticmethod
+    def forget_team(team_id: int) -> None:
+        """Drop cached scores of a team, e.g. before the team is deleted."""
+        _score_cache.invalidate_team(team_id)
+
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """Return the size and hit/miss counters of the score cache."""
+        return _score_cache.stats()
+
+    @staticmethod
+    def recommend_teams(
+        user_id: int,
+        class_ids: List[int],
+        limit: int = 20,
+        after: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[Tuple[Team, int]], Optional[Tuple[int, int]]]:
+        """Return one page of OPEN teams with free seats that share tags with the user.
+
+        Teams come from the given classes and from every category. The query
+        starts from the user's tags and walks the ``team_tags`` (kind, tag)
+        index, so only teams sharing at least one tag are visited instead of
+        scanning ``teams``. Ordering and cursors follow ``rank_teams``.
+        Each team's class and category are loaded up front for the
+        "클래스 · 이름" / "카테고리 · 이름" labels.
+        """
+        my_team_ids = db.session.query(TeamMember.team_id).filter(TeamMember.user_id == user_id)
+
+        score = db.func.count(db.distinct(TeamTag.tag))
+        scope = [Team.category_id.isnot(None)]
+        if class_ids:
+            scope.append(Team.class_id.in_(class_ids))
+
+        query = (
+            db.session.query(Team, score)
+            .select_from(UserTag)
+            .join(TeamTag, db.and_(TeamTag.kind == TagService.SKILL, TeamTag.tag == UserTag.tag))
+            .join(Team, Team.id == TeamTag.team_id)
+            .filter(
+                UserTag.user_id == user_id,
+                Team.recruit_status == "OPEN",
+                db.or_(*scope),
+                ~Team.id.in_(my_team_ids),
+                db.or_(Team.capacity.is_(None), Team.member_count < Team.capacity),
+            )
+            .group_by(Team.id)
+            # 라벨 표시용 클래스/카테고리를 페이지 단위로 한 번에 조회 (GROUP BY 쿼리에 조인을 더하지 않음)
+            .options(selectinload(Team.class_room), selectinload(Team.category))
+        )
+        if after is not None:
+            last_score, last_id = after
+            query = query.having(
+                db.or_(score < last_score, db.and_(score == last_score, Team.id < last_id))
+            )
+        rows = query.order_by(score.desc(), Team.id.desc()).limit(limit + 1).all()
+
+        page = [(team, team_score) for team, team_score in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last_team, last_score = page[-1]
+            next_cursor = (last_score, last_team.id)
+        return page, next_cursor
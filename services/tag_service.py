@@ -0,0 +1,131 @@
+"""
+프로필/팀 태그 테이블을 관리하는 서비스 레이어입니다.
+
+프로필의 기술/목표/성격 문자열과 팀의 필요 기술/목표를 토큰으로 나누어
+``UserTag``/``TeamTag`` 테이블에 저장합니다. 태그는 쓰기 시점
+(회원가입, 프로필 수정, 팀 생성/수정)에 한 번만 파싱되며, 조회 시에는
+조인과 ``GROUP BY``로 후보 검색과 매칭 점수 계산을 수행합니다.
+"""
+
+from typing import Iterable, Optional, Set
+
+from database import db
+from models.profile import Profile
+from models.team import Team
+from models.team_tag import TeamTag
+from models.user_tag import UserTag
+
+
+class TagService:
+    """Maintains normalized user/team tag tables and tag-based lookups."""
+
+    SKILL = "SKILL"
+    GOAL = "GOAL"
+    PERSONALITY = "PERSONALITY"
+
+    @staticmethod
+    def tokenize_csv(value: Optional[str]) -> Set[str]:
+        """Split a comma separated string into stripped, lower-cased tokens."""
+        if not value:
+            return set()
+        return {t.strip().lower() for t in value.split(",") if t.strip()}
+
+    @staticmethod
+    def tokenize_words(value: Optional[str]) -> Set[str]:
+        """Split free text (e.g. a team goal) into lower-cased words."""
+        if not value:
+            return set()
+        return {t.lower() for t in value.split()}
+
+    # =================================
+    # 사용자 태그
+    # =================================
+    @staticmethod
+    def sync_user_tags(
+        user_id: int,
+        skills: Optional[str],
+        goals: Optional[str],
+        personality: Optional[str] = None,
+    ) -> None:
+        """Replace the stored tags of a user. The caller commits."""
+        TagService.delete_user_tags(user_id)
+        rows = [
+            {"user_id": user_id, "kind": kind, "tag": tag}
+            for kind, value in (
+                (TagService.SKILL, skills),
+                (TagService.GOAL, goals),
+                (TagService.PERSONALITY, personality),
+            )
+            for tag in TagService.tokenize_csv(value)
+        ]
+        if rows:
+            db.session.execute(db.insert(UserTag), rows)
+
+    @staticmethod
+    def delete_user_tags(user_id: int) -> None:
+        """Remove every stored tag of a user. The caller commits."""
+        UserTag.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+
+    @staticmethod
+    def user_ids_matching(skills: Iterable[str], goal_words: Iterable[str]):
+        """Return a subquery of user ids sharing at least one skill, goal or personality token.
+
+        Goal and personality tags are both matched against the team's goal
+        words, mirroring the goal and personality terms of the match score.
+        """
+        skills = list(skills)
+        goal_words = list(goal_words)
+        conditions = []
+        if skills:
+            conditions.append((UserTag.kind == TagService.SKILL) & UserTag.tag.in_(skills))
+        if goal_words:
+            conditions.append(
+                UserTag.kind.in_((TagService.GOAL, TagService.PERSONALITY)) & UserTag.tag.in_(goal_words)
+            )
+        if not conditions:
+            return None
+        return db.session.query(UserTag.user_id).filter(db.or_(*conditions)).distinct()
+
+    # =================================
+    # 팀 태그
+    # =================================
+    @staticmethod
+    def sync_team_tags(team_id: int, required_skills: Optional[str], goal: Optional[str]) -> None:
+        """Replace the stored tags of a team. The caller commits."""
+        TeamTag.query.filter_by(team_id=team_id).delete(synchronize_session=False)
+        rows = [
+            {"team_id": team_id, "kind": TagService.SKILL, "tag": tag}
+            for tag in TagService.tokenize_csv(required_skills)
+        ] + [
+            {"team_id": team_id, "kind": TagService.GOAL, "tag": tag}
+            for tag in TagService.tokenize_words(goal)
+        ]
+        if rows:
+            db.session.execute(db.insert(TeamTag), rows)
+
+    # =================================
+    # 색인 재구축
+    # =================================
+    @staticmethod
+    def rebuild_tags() -> int:
+        """Rebuild user and team tags from the source columns; return the number of rows parsed."""
+        UserTag.query.delete(synchronize_session=False)
+        TeamTag.query.delete(synchronize_session=False)
+        profiles = Profile.query.all()
+        for profile in profiles:
+            TagService.sync_user_tags(
+                profile.user_id, profile.skills, profile.goals, profile.personality
+            )
+        teams = Team.query.all()
+        for team in teams:
+            TagService.sync_team_tags(team.id, team.required_skills, team.goal)
+        db.session.commit()
+        return len(profiles) + len(teams)
+
+    @staticmethod
+    def ensure_index() -> None:
+        """Build the tag tables once for databases created before they existed."""
+        users_missing = UserTag.query.first() is None and Profile.query.first() is not None
+        teams_missing = TeamTag.query.first() is None and Team.query.first() is not None
+        if users_missing or teams_missing:
+            TagService.rebuild_tags()
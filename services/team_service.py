@@ -6,8 +6,11 @@
 프로젝트 핵심 기능과 확장 기능을 포함합니다.
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy.orm import joinedload, selectinload
+
+from config import Config
 from database import db
 from models.team import Team
 from models.team_member import TeamMember
@@ -15,6 +18,13 @@ from models.team_application import TeamApplication
 from models.user import User
 from models.category import Category
 from models.class_ import ClassRoom
+from services.tag_service import TagService
+from services.matching_service import MatchingService
+from services.ranking_service import RankingService
+from utils.cache import TTLCache
+
+# ("class" | "category", id) → 이름. 팀 라벨을 만들 때 매번 클래스/카테고리를 조회하지 않도록 캐시
+_label_names = TTLCache(Config.TEAM_LABEL_CACHE_TTL)
 
 
 class TeamService:
@@ -26,15 +36,61 @@ class TeamService:
     @staticmethod
     def get_team_type_label(team: Team) -> str:
         """Return '클래스: name', '카테고리: name', or just team name if neither."""
-        if team.class_id:
-            cls = ClassRoom.query.get(team.class_id)
-            if cls:
-                return f"클래스: {cls.name}"
-        if team.category_id:
-            cat = Category.query.get(team.category_id)
-            if cat:
-                return f"카테고리: {cat.name}"
-        return f"{team.name}"
+        return TeamService.get_team_type_labels([team])[team.id]
+
+    @staticmethod
+    def get_team_type_labels(teams: Iterable[Team]) -> Dict[int, str]:
+        """Return ``{team_id: label}`` for many teams.
+
+        Class and category names come from a process-local TTL cache; names
+        missing from it are loaded together in a single query.
+        """
+        teams = list(teams)
+        wanted = set()
+        for team in teams:
+            if team.class_id:
+                wanted.add(("class", team.class_id))
+            if team.category_id:
+                wanted.add(("category", team.category_id))
+
+        names = {}
+        for key in wanted:
+            name = _label_names.get(key)
+            if name is not None:
+                names[key] = name
+
+        # 캐시에 없는 클래스/카테고리 이름은 한 번의 UNION 쿼리로 조회
+        missing = wanted - names.keys()
+        if missing:
+            class_ids = [i for kind, i in missing if kind == "class"]
+            category_ids = [i for kind, i in missing if kind == "category"]
+            query = db.union_all(
+                db.select(db.literal("class").label("kind"), ClassRoom.id, ClassRoom.name)
+                .where(ClassRoom.id.in_(class_ids)),
+                db.select(db.literal("category").label("kind"), Category.id, Category.name)
+                .where(Category.id.in_(category_ids)),
+            )
+            for kind, id_, name in db.session.execute(query):
+                names[(kind, id_)] = name
+                _label_names.put((kind, id_), name)
+
+        labels = {}
+        for team in teams:
+            if ("class", team.class_id) in names:
+                labels[team.id] = f"클래스: {names[('class', team.class_id)]}"
+            elif ("category", team.category_id) in names:
+                labels[team.id] = f"카테고리: {names[('category', team.category_id)]}"
+            else:
+                labels[team.id] = f"{team.name}"
+        return labels
+
+    @staticmethod
+    def invalidate_label(class_id: Optional[int] = None, category_id: Optional[int] = None) -> None:
+        """Forget a cached class/category name after it is created, renamed or deleted."""
+        if class_id is not None:
+            _label_names.invalidate(("class", class_id))
+        if category_id is not None:
+            _label_names.invalidate(("category", category_id))
 
     # =================================
     # 팀 생성
@@ -59,37 +115,230 @@ class TeamService:
             class_id=class_id,
             category_id=category_id,
             openchat_url=openchat_url,
+            member_count=1,
         )
         db.session.add(team)
         db.session.flush()
         # 생성자를 리더로 멤버에 추가
         leader = TeamMember(team_id=team.id, user_id=owner_id, role="LEADER")
         db.session.add(leader)
+        TagService.sync_team_tags(team.id, required_skills, goal)
+        db.session.commit()
+        return team
+
+    # =================================
+    # 팀 정보 수정
+    # =================================
+    @staticmethod
+    def update_team(
+        team: Team,
+        name: str,
+        goal: str | None,
+        required_skills: str | None,
+        capacity: int | None,
+        openchat_url: str | None,
+    ) -> Team:
+        team.name = name
+        team.goal = goal
+        team.required_skills = required_skills
+        team.capacity = capacity
+        team.openchat_url = openchat_url
+        team.version = (team.version or 0) + 1
+        TagService.sync_team_tags(team.id, required_skills, goal)
         db.session.commit()
+        # 이전 팀 정보로 계산된 '매칭 점수순' 점수 제거
+        RankingService.forget_team(team.id)
         return team
 
     # =================================
     # 클래스 / 카테고리 팀 조회
     # =================================
     @staticmethod
-    def list_teams_for_class(class_id: int) -> List[Team]:
-        return Team.query.filter_by(class_id=class_id).all()
+    def list_teams_for_class(
+        class_id: int,
+        limit: int = 20,
+        after: Optional[int] = None,
+        open_only: bool = False,
+        has_seats: bool = False,
+    ) -> Tuple[List[Team], Optional[int]]:
+        return TeamService._page_teams(Team.class_id == class_id, limit, after, open_only, has_seats)
 
     @staticmethod
-    def list_teams_for_category(category_id: int) -> List[Team]:
-        return Team.query.filter_by(category_id=category_id).all()
+    def list_teams_for_category(
+        category_id: int,
+        limit: int = 20,
+        after: Optional[int] = None,
+        open_only: bool = False,
+        has_seats: bool = False,
+    ) -> Tuple[List[Team], Optional[int]]:
+        return TeamService._page_teams(Team.category_id == category_id, limit, after, open_only, has_seats)
+
+    @staticmethod
+    def listing_filters(open_only: bool = False, has_seats: bool = False) -> list:
+        """Return the filter criteria for 'OPEN only' and 'has free seats' listings."""
+        criteria = []
+        if open_only:
+            criteria.append(Team.recruit_status == "OPEN")
+        if has_seats:
+            criteria.append(db.or_(Team.capacity.is_(None), Team.member_count < Team.capacity))
+        return criteria
+
+    @staticmethod
+    def _page_teams(scope, limit: int, after: Optional[int], open_only: bool, has_seats: bool):
+        """Return one page of teams in id order and the cursor of the next page.
+
+        Seats used come from the maintained ``member_count`` column, so the
+        page is a single query with no per-team member count.
+        """
+        query = Team.query.filter(scope, *TeamService.listing_filters(open_only, has_seats))
+        if after is not None:
+            query = query.filter(Team.id > after)
+        rows = query.order_by(Team.id).limit(limit + 1).all()
+        page = rows[:limit]
+        return page, page[-1].id if len(rows) > limit else None
+
+    # =================================
+    # 팀원 수 (정원 자리 확보 / 반환)
+    # =================================
+    @staticmethod
+    def claim_seat(team_id: int, seats: int = 1) -> bool:
+        """Atomically add ``seats`` to the team's member count if they fit its capacity.
+
+        Runs one conditional UPDATE, so concurrent approvals cannot push a
+        team over capacity. Returns ``False`` when the seats are not free.
+        Nothing is committed.
+        """
+        claimed = (
+            Team.query
+            .filter(
+                Team.id == team_id,
+                db.or_(Team.capacity.is_(None), Team.member_count + seats <= Team.capacity),
+            )
+            .update({Team.member_count: Team.member_count + seats}, synchronize_session=False)
+        )
+        return claimed == 1
+
+    @staticmethod
+    def release_seat(team_id: int, seats: int = 1) -> None:
+        """Give back ``seats`` after members leave the team. Nothing is committed."""
+        Team.query.filter(Team.id == team_id).update(
+            {Team.member_count: db.case((Team.member_count > seats, Team.member_count - seats), else_=0)},
+            synchronize_session=False,
+        )
+
+    @staticmethod
+    def reconcile_member_counts() -> int:
+        """Recompute ``member_count`` from ``team_members`` where it drifted; returns teams fixed."""
+        actual = (
+            db.select(db.func.count(TeamMember.id))
+            .where(TeamMember.team_id == Team.id)
+            .scalar_subquery()
+        )
+        fixed = (
+            Team.query
+            .filter(Team.member_count != actual)
+            .update({Team.member_count: actual}, synchronize_session=False)
+        )
+        db.session.commit()
+        return fixed
+
+    # =================================
+    # 팀 상세 화면 데이터
+    # =================================
+    @staticmethod
+    def build_team_detail(team_id: int, current_user_id: Optional[int]) -> Optional[dict]:
+        """Load everything ``team_detail.html`` renders in a fixed number of queries.
+
+        The team comes with its class/category and members (with users) eagerly
+        loaded. Leaders also get pending applications (with applicant profiles)
+        and pending invitations (with invitees), one query each. Returns
+        ``None`` when the team does not exist.
+        """
+        from models.team_invitation import TeamInvitation
+
+        # 1. 팀 + 클래스/카테고리 + 팀원(사용자 포함)
+        team = (
+            Team.query
+            .options(
+                joinedload(Team.class_room),
+                joinedload(Team.category),
+                selectinload(Team.members).joinedload(TeamMember.user),
+            )
+            .filter(Team.id == team_id)
+            .first()
+        )
+        if not team:
+            return None
+
+        is_leader = current_user_id == team.owner_id
+        members = [{"member": mem, "user": mem.user} for mem in sorted(team.members, key=lambda m: m.id)]
+        user_member = next((mem for mem in team.members if mem.user_id == current_user_id), None)
+
+        # 2. 팀장에게만 보이는 대기 중인 지원/초대 (사용자와 프로필을 함께 조회)
+        applications, invitations = [], []
+        if is_leader:
+            applications = [
+                {"application": app, "user": app.user}
+                for app in TeamApplication.query
+                .options(joinedload(TeamApplication.user).joinedload(User.profile))
+                .filter_by(team_id=team_id, status="PENDING")
+                .order_by(TeamApplication.id)
+                .all()
+            ]
+            invitations = [
+                {"invitation": inv, "user": inv.to_user}
+                for inv in TeamInvitation.query
+                .options(joinedload(TeamInvitation.to_user))
+                .filter_by(team_id=team_id, status="PENDING")
+                .order_by(TeamInvitation.id)
+                .all()
+            ]
+
+        # 3. 현재 사용자의 대기 중인 지원/초대 (팀원이 아닐 때만 필요)
+        user_pending_application = None
+        user_pending_invite = None
+        if current_user_id and not user_member:
+            user_pending_application = TeamApplication.query.filter_by(
+                team_id=team_id, user_id=current_user_id, status="PENDING"
+            ).first()
+            user_pending_invite = TeamInvitation.query.filter_by(
+                team_id=team_id, to_user_id=current_user_id, status="PENDING"
+            ).first()
+
+        return {
+            "team": team,
+            "members": members,
+            "is_leader": is_leader,
+            "applications": applications,
+            "invitations": invitations,
+            "user_member": user_member,
+            "user_pending_application": user_pending_application,
+            "user_pending_invite": user_pending_invite,
+        }
 
     # =================================
     # 가입 신청
     # =================================
     @staticmethod
     def apply_to_team(team_id: int, user_id: int, message: str = None) -> TeamApplication:
+        team = Team.query.get(team_id)
+        if not team:
+            raise ValueError("존재하지 않는 팀입니다.")
         if TeamMember.query.filter_by(team_id=team_id, user_id=user_id).first():
             raise ValueError("이미 팀 멤버입니다.")
         if TeamApplication.query.filter_by(team_id=team_id, user_id=user_id).first():
             raise ValueError("이미 지원했습니다.")
         application = TeamApplication(team_id=team_id, user_id=user_id, message=message)
         db.session.add(application)
+
+        # 팀장에게 지원 알림 (짧은 시간 안의 지원은 알림 한 건으로 합쳐짐)
+        from services.notification_service import NotificationService
+        NotificationService.enqueue([{
+            "user_id": team.owner_id,
+            "type": "APPLICATION",
+            "message": f"[{TeamService.get_team_type_label(team)}] {team.name}팀에 새 지원이 도착했습니다.",
+            "related_id": team_id,
+        }])
         db.session.commit()
         return application
 
@@ -111,29 +360,27 @@ class TeamService:
         if not accept:
             app.status = "REJECTED"
             app.decided_at = db.func.now()
-            NotificationService.send_notification(
-                app.user_id,
-                "APPLICATION_REJECTED",
-                f"[{team_label}] 팀 지원이 거절되었습니다.",
-                related_id=team.id,
-            )
+            NotificationService.enqueue([{
+                "user_id": app.user_id,
+                "type": "APPLICATION_REJECTED",
+                "message": f"[{team_label}] 팀 지원이 거절되었습니다.",
+                "related_id": team.id,
+            }])
             db.session.commit()
             return
 
-        # 2) 승인인데 정원 체크
-        if team.capacity is not None:
-            current_members = TeamMember.query.filter_by(team_id=team.id).count()
-            if current_members >= team.capacity:
-                app.status = "REJECTED"
-                app.decided_at = db.func.now()
-                NotificationService.send_notification(
-                    app.user_id,
-                    "APPLICATION_REJECTED",
-                    f"[{team_label}] 팀 정원이 가득 차 지원이 거절되었습니다.",
-                    related_id=team.id,
-                )
-                db.session.commit()
-                return
+        # 2) 승인인데 정원 체크 (조건부 UPDATE 한 번으로 자리 확보)
+        if not TeamService.claim_seat(team.id):
+            app.status = "REJECTED"
+            app.decided_at = db.func.now()
+            NotificationService.enqueue([{
+                "user_id": app.user_id,
+                "type": "APPLICATION_REJECTED",
+                "message": f"[{team_label}] 팀 정원이 가득 차 지원이 거절되었습니다.",
+                "related_id": team.id,
+            }])
+            db.session.commit()
+            return
 
         # 3) 승인 및 팀원 추가
         member = TeamMember(team_id=team.id, user_id=app.user_id, role="MEMBER")
@@ -142,14 +389,114 @@ class TeamService:
         app.status = "ACCEPTED"
         app.decided_at = db.func.now()
 
-        NotificationService.send_notification(
-            app.user_id,
-            "APPLICATION_ACCEPTED",
-            f"[{team_label}] 팀 지원이 승인되었습니다.",
-            related_id=team.id,
+        NotificationService.enqueue([{
+            "user_id": app.user_id,
+            "type": "APPLICATION_ACCEPTED",
+            "message": f"[{team_label}] 팀 지원이 승인되었습니다.",
+            "related_id": team.id,
+        }])
+
+        db.session.commit()
+
+    @staticmethod
+    def process_applications(
+        team_id: int,
+        by_user_id: int,
+        accept: bool,
+        application_ids: Optional[Iterable[int]] = None,
+        top_n: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """Accept or reject many pending applications in one transaction.
+
+        With ``application_ids`` only those applications are processed, in id
+        order; when accepting, the ones that no longer fit are rejected as
+        full. Without ``application_ids``, acceptance goes down every pending
+        application by match score and stops when the team is full or
+        ``top_n`` (at least 1) are accepted; the rest stay pending. Free seats are computed
+        once and claimed with a single conditional UPDATE. Returns the number
+        of applications accepted and rejected.
+        """
+        from services.notification_service import NotificationService
+
+        team = Team.query.get(team_id)
+        if not team:
+            raise ValueError("존재하지 않는 팀입니다.")
+        if team.owner_id != by_user_id:
+            raise ValueError("팀장만 지원을 처리할 수 있습니다.")
+        if top_n is not None and top_n < 1:
+            raise ValueError("승인할 인원은 1명 이상이어야 합니다.")
+
+        # 1. 대기 중인 지원을 지원자/프로필과 함께 한 번에 조회
+        query = (
+            TeamApplication.query
+            .options(joinedload(TeamApplication.user).joinedload(User.profile))
+            .filter(TeamApplication.team_id == team_id, TeamApplication.status == "PENDING")
         )
+        if application_ids is not None:
+            query = query.filter(TeamApplication.id.in_(list(application_ids)))
+        apps = query.order_by(TeamApplication.id).all()
+        if not apps:
+            return {"accepted": 0, "rejected": 0}
+
+        team_label = TeamService.get_team_type_label(team)
+        accepted, rejected, notifications = [], [], []
+
+        if not accept:
+            rejected = apps
+        else:
+            # 2. 이미 팀원이 된 지원자는 자리 없이 승인 처리
+            member_ids = {
+                uid for (uid,) in db.session.query(TeamMember.user_id)
+                .filter(TeamMember.team_id == team_id, TeamMember.user_id.in_([a.user_id for a in apps]))
+            }
+            already = [a for a in apps if a.user_id in member_ids]
+            apps = [a for a in apps if a.user_id not in member_ids]
+
+            # 3. 선택 순서 또는 매칭 점수 순으로 남은 자리만큼 승인
+            if application_ids is None:
+                scores = MatchingService.score_candidates([a.user for a in apps], team)
+                ranked = sorted(zip(scores, apps), key=lambda pair: (-pair[0], pair[1].id))
+                apps = [a for _, a in ranked][:top_n] if top_n is not None else [a for _, a in ranked]
+            free = len(apps) if team.capacity is None else max(team.capacity - team.member_count, 0)
+            accepted = apps[:free]
+            # 점수순 승인에서는 남은 지원을 대기 상태로 둠
+            rejected = apps[free:] if application_ids is not None else []
+
+            if accepted and not TeamService.claim_seat(team_id, len(accepted)):
+                db.session.rollback()
+                raise ValueError("처리 중 팀 정원이 변경되었습니다. 다시 시도해 주세요.")
+            db.session.add_all(
+                TeamMember(team_id=team_id, user_id=a.user_id, role="MEMBER") for a in accepted
+            )
+            for app in already:
+                app.status = "ACCEPTED"
+                app.decided_at = db.func.now()
 
+        # 4. 상태 변경과 알림을 한 번에 기록
+        for app in accepted:
+            app.status = "ACCEPTED"
+            app.decided_at = db.func.now()
+            notifications.append({
+                "user_id": app.user_id,
+                "type": "APPLICATION_ACCEPTED",
+                "message": f"[{team_label}] 팀 지원이 승인되었습니다.",
+                "related_id": team_id,
+            })
+        for app in rejected:
+            app.status = "REJECTED"
+            app.decided_at = db.func.now()
+            notifications.append({
+                "user_id": app.user_id,
+                "type": "APPLICATION_REJECTED",
+                "message": (
+                    f"[{team_label}] 팀 정원이 가득 차 지원이 거절되었습니다." if accept
+                    else f"[{team_label}] 팀 지원이 거절되었습니다."
+                ),
+                "related_id": team_id,
+            })
+        NotificationService.enqueue(notifications)
         db.session.commit()
+        return {"accepted": len(accepted), "rejected": len(rejected)}
 
     # =================================
     # 팀 초대
@@ -182,19 +529,99 @@ class TeamService:
             team_id=team_id, from_user_id=from_user_id, to_user_id=to_user_id
         )
         db.session.add(invitation)
+        db.session.flush()
 
         from services.notification_service import NotificationService
 
         team_label = TeamService.get_team_type_label(team)
-        NotificationService.send_notification(
-            to_user_id,
-            "INVITATION",
-            f"[{team_label}] {team.name}팀에서 초대가 도착했습니다.",
-            related_id=invitation.id,
-        )
+        NotificationService.enqueue([{
+            "user_id": to_user_id,
+            "type": "INVITATION",
+            "message": f"[{team_label}] {team.name}팀에서 초대가 도착했습니다.",
+            "related_id": invitation.id,
+        }])
 
         db.session.commit()
 
+    @staticmethod
+    def invite_users(team_id: int, from_user_id: int, to_user_ids: Iterable[int]) -> Dict[int, str]:
+        """Invite many users at once and return ``{user_id: result}``.
+
+        The result is ``"INVITED"`` or the reason the user was skipped. Class
+        membership, existing membership and pending invitations are checked
+        with one set-based query each. All invitations and their notifications
+        are written in a single transaction.
+        """
+        from models.class_member import ClassMember
+        from models.team_invitation import TeamInvitation
+        from services.notification_service import NotificationService
+
+        team = Team.query.get(team_id)
+        if not team:
+            raise ValueError("존재하지 않는 팀입니다.")
+        if team.owner_id != from_user_id:
+            raise ValueError("팀장만 초대할 수 있습니다.")
+
+        # 중복 제거 (입력 순서 유지)
+        user_ids = list(dict.fromkeys(to_user_ids))
+        if not user_ids:
+            return {}
+
+        # 1. 초대 불가 사용자를 집합 단위로 조회
+        existing_users = {
+            uid for (uid,) in db.session.query(User.id).filter(User.id.in_(user_ids))
+        }
+        in_class = None
+        if team.class_id:
+            in_class = {
+                uid for (uid,) in db.session.query(ClassMember.user_id)
+                .filter(ClassMember.class_id == team.class_id, ClassMember.user_id.in_(user_ids))
+            }
+        members = {
+            uid for (uid,) in db.session.query(TeamMember.user_id)
+            .filter(TeamMember.team_id == team_id, TeamMember.user_id.in_(user_ids))
+        }
+        pending = {
+            uid for (uid,) in db.session.query(TeamInvitation.to_user_id)
+            .filter(
+                TeamInvitation.team_id == team_id,
+                TeamInvitation.status == "PENDING",
+                TeamInvitation.to_user_id.in_(user_ids),
+            )
+        }
+
+        results: Dict[int, str] = {}
+        invitations = []
+        for uid in user_ids:
+            if uid not in existing_users:
+                results[uid] = "존재하지 않는 사용자입니다."
+            elif in_class is not None and uid not in in_class:
+                results[uid] = "해당 수업에 속한 사용자만 초대할 수 있습니다."
+            elif uid in members:
+                results[uid] = "이미 팀 멤버입니다."
+            elif uid in pending:
+                results[uid] = "이미 초대되었습니다."
+            else:
+                results[uid] = "INVITED"
+                invitations.append(TeamInvitation(team_id=team_id, from_user_id=from_user_id, to_user_id=uid))
+
+        # 2. 초대와 알림을 한 트랜잭션으로 저장
+        if invitations:
+            db.session.add_all(invitations)
+            db.session.flush()
+            team_label = TeamService.get_team_type_label(team)
+            NotificationService.enqueue(
+                {
+                    "user_id": inv.to_user_id,
+                    "type": "INVITATION",
+                    "message": f"[{team_label}] {team.name}팀에서 초대가 도착했습니다.",
+                    "related_id": inv.id,
+                }
+                for inv in invitations
+            )
+            db.session.commit()
+        return results
+
     @staticmethod
     def process_invitation(invitation_id: int, accept: bool, current_user_id: int) -> None:
         from models.team_invitation import TeamInvitation
@@ -213,42 +640,35 @@ class TeamService:
         invitation.status = "ACCEPTED" if accept else "REJECTED"
         invitation.responded_at = db.func.now()
 
+        def notify_inviter(type_: str, message: str) -> None:
+            NotificationService.enqueue([{
+                "user_id": invitation.from_user_id,
+                "type": type_,
+                "message": message,
+                "related_id": invitation.id,
+            }])
+
         if accept:
-            if team.capacity is not None:
-                current_members = TeamMember.query.filter_by(team_id=team.id).count()
-                if current_members >= team.capacity:
-                    invitation.status = "REJECTED"
-                    NotificationService.send_notification(
-                        invitation.from_user_id,
-                        "INVITATION_REJECTED",
-                        f"[{team_label}] 팀 정원이 가득 차 초대가 거절되었습니다.",
-                        related_id=invitation.id,
-                    )
-                    raise ValueError("정원이 모두 차 가입하지 못했습니다.")
-                else:
-                    member = TeamMember(team_id=team.id, user_id=current_user_id, role="MEMBER")
-                    db.session.add(member)
-                    NotificationService.send_notification(
-                        invitation.from_user_id,
-                        "INVITATION_ACCEPTED",
-                        f"[{team_label}] 팀에 {user_name} 님이 초대를 수락했습니다.",
-                        related_id=invitation.id,
-                    )
-            else:
-                member = TeamMember(team_id=team.id, user_id=current_user_id, role="MEMBER")
-                db.session.add(member)
-                NotificationService.send_notification(
-                    invitation.from_user_id,
-                    "INVITATION_ACCEPTED",
-                    f"[{team_label}] 팀에 {user_name} 님이 초대를 수락했습니다.",
-                    related_id=invitation.id,
+            # 조건부 UPDATE 한 번으로 자리 확보 (정원이 없으면 항상 성공)
+            if not TeamService.claim_seat(team.id):
+                invitation.status = "REJECTED"
+                notify_inviter(
+                    "INVITATION_REJECTED",
+                    f"[{team_label}] 팀 정원이 가득 차 초대가 거절되었습니다.",
                 )
+                # 거절 처리와 알림은 저장한 뒤 예외로 알림
+                db.session.commit()
+                raise ValueError("정원이 모두 차 가입하지 못했습니다.")
+            member = TeamMember(team_id=team.id, user_id=current_user_id, role="MEMBER")
+            db.session.add(member)
+            notify_inviter(
+                "INVITATION_ACCEPTED",
+                f"[{team_label}] 팀에 {user_name} 님이 초대를 수락했습니다.",
+            )
         else:
-            NotificationService.send_notification(
-                invitation.from_user_id,
+            notify_inviter(
                 "INVITATION_REJECTED",
                 f"[{team_label}] 팀 초대를 {user_name} 님이 거절했습니다.",
-                related_id=invitation.id,
             )
 
         db.session.commit()
@@ -276,18 +696,23 @@ class TeamService:
             raise ValueError("팀장은 본인을 제거할 수 없습니다. 위임 후 탈퇴하세요.")
 
         db.session.delete(membership)
+        TeamService.release_seat(team_id)
 
         from services.notification_service import NotificationService
         team_label = TeamService.get_team_type_label(team)
 
         if user_id != by_user_id:
-            NotificationService.send_notification(
-                user_id, "REMOVED", f"[{team_label}] 팀에서 추방되었습니다.", related_id=team_id
-            )
+            notification = {
+                "user_id": user_id, "type": "REMOVED",
+                "message": f"[{team_label}] 팀에서 추방되었습니다.", "related_id": team_id,
+            }
         else:
-            NotificationService.send_notification(
-                team.owner_id, "WITHDRAWAL", f"[{team_label}] 팀에서 {User.query.get(user_id).name} 님이 탈퇴했습니다.", related_id=team_id
-            )
+            notification = {
+                "user_id": team.owner_id, "type": "WITHDRAWAL",
+                "message": f"[{team_label}] 팀에서 {User.query.get(user_id).name} 님이 탈퇴했습니다.",
+                "related_id": team_id,
+            }
+        NotificationService.enqueue([notification])
 
         db.session.commit()
 
@@ -310,7 +735,10 @@ class TeamService:
         team.owner_id = new_leader_id
 
         from services.notification_service import NotificationService
-        NotificationService.send_notification(new_leader_id, "DELEGATED", "팀장 권한이 위임되었습니다.", related_id=team_id)
+        NotificationService.enqueue([{
+            "user_id": new_leader_id, "type": "DELEGATED",
+            "message": "팀장 권한이 위임되었습니다.", "related_id": team_id,
+        }])
 
         db.session.commit()
 
@@ -328,11 +756,22 @@ class TeamService:
         from services.notification_service import NotificationService
         members = TeamMember.query.filter_by(team_id=team_id).all()
         team_label = TeamService.get_team_type_label(team)
-        for mem in members:
-            if mem.user_id != by_user_id:
-                NotificationService.send_notification(
-                    mem.user_id, "TEAM_DISSOLVED", f"[{team_label}] 팀이 해체되었습니다.", related_id=team_id
-                )
+        NotificationService.enqueue(
+            (
+                {
+                    "user_id": mem.user_id,
+                    "type": "TEAM_DISSOLVED",
+                    "message": f"[{team_label}] 팀이 해체되었습니다.",
+                    "related_id": team_id,
+                }
+                for mem in members
+                if mem.user_id != by_user_id
+            ),
+        )
+
+        from services.matching_job_service import MatchingJobService
+        MatchingJobService.purge_team(team_id)
+        RankingService.forget_team(team_id)
 
         db.session.delete(team)
         db.session.commit()
@@ -16,6 +16,8 @@ from models.profile import Profile
 from models.team_member import TeamMember
 from models.class_member import ClassMember
 from models.friend import Friend
+from services.tag_service import TagService
+from services.ranking_service import RankingService
 
 
 class UserService:
@@ -64,6 +66,8 @@ class UserService:
             skills=skills,
         )
         db.session.add(profile)
+        # 5. 태그 테이블 갱신
+        TagService.sync_user_tags(user.id, skills, goals, personality)
         # 최종저장
         db.session.commit()
         return user
@@ -103,7 +107,14 @@ class UserService:
         profile.personality = personality
         profile.goals = goals
         profile.skills = skills
+        profile.version = (profile.version or 0) + 1
+        TagService.sync_user_tags(user.id, skills, goals, personality)
+        # 이 사용자가 후보가 될 수 있는 팀들의 매칭 결과를 다시 계산 대상으로 표시
+        from services.matching_job_service import MatchingJobService
+        MatchingJobService.mark_outdated_for_user(user.id)
         db.session.commit()
+        # 이전 프로필로 계산된 '매칭 점수순' 점수 제거
+        RankingService.forget_user(user.id)
         return user
 
     @staticmethod
@@ -113,33 +124,68 @@ class UserService:
         user = User.query.get(user_id)
         if not user:
             raise ValueError("사용자를 찾을 수 없습니다.")
-        # 1. 탈퇴 방지 조건 체크
+        from models.team import Team
+        from models.team_application import TeamApplication
+        from models.team_invitation import TeamInvitation
+        from models.notification_outbox import NotificationOutbox
+        from services.matching_job_service import MatchingJobService
+        from services.notification_service import NotificationService
+        from services.team_service import TeamService
+
+        # 1. 탈퇴 방지 조건 체크 (팀장인 팀과 팀원 수를 한 번에 조회)
         blocking_messages = []
-        leader_memberships = TeamMember.query.filter_by(user_id=user_id, role="LEADER").all()
-        for membership in leader_memberships:
-            others = TeamMember.query.filter(
-                TeamMember.team_id == membership.team_id,
-                TeamMember.user_id != user_id,
-            ).count()
-            team_name = membership.team.name if membership.team else f"팀 {membership.team_id}"
-            if others > 0:
+        for team_name, member_count in (
+            db.session.query(Team.name, Team.member_count)
+            .join(TeamMember, TeamMember.team_id == Team.id)
+            .filter(TeamMember.user_id == user_id, TeamMember.role == "LEADER")
+            .order_by(Team.id)
+        ):
+            if member_count > 1:
                 blocking_messages.append(f"{team_name} 팀장 권한을 다른 팀원에게 위임해주세요.")
             else:
                 blocking_messages.append(f"{team_name} 팀을 해체한 후 탈퇴가 가능합니다.")
         if blocking_messages:
             raise ValueError("탈퇴 전 조치 필요: " + " / ".join(blocking_messages))
-        # 2. 데이터 정리
-        from services.team_service import TeamService
-
-        memberships = TeamMember.query.filter_by(user_id=user_id).all()
-        for membership in memberships:
-            TeamService.remove_member(membership.team_id, user_id, user_id)
 
+        # 2. 소속 팀에서 탈퇴 (팀장에게 보낼 탈퇴 알림은 한 번에 기록)
+        teams = (
+            Team.query
+            .join(TeamMember, TeamMember.team_id == Team.id)
+            .filter(TeamMember.user_id == user_id)
+            .all()
+        )
+        if teams:
+            labels = TeamService.get_team_type_labels(teams)
+            NotificationService.enqueue(
+                {
+                    "user_id": team.owner_id,
+                    "type": "WITHDRAWAL",
+                    "message": f"[{labels[team.id]}] 팀에서 {user.name} 님이 탈퇴했습니다.",
+                    "related_id": team.id,
+                }
+                for team in teams
+            )
+            Team.query.filter(Team.id.in_([team.id for team in teams])).update(
+                {Team.member_count: Team.member_count - 1}, synchronize_session=False
+            )
+            TeamMember.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+
+        # 3. 클래스 멤버십, 친구 관계, 대기 중인 지원/초대, 전달 전 알림 등 일괄 삭제
         ClassMember.query.filter_by(user_id=user_id).delete(synchronize_session=False)
         Friend.query.filter(
             (Friend.user_id == user_id) | (Friend.friend_id == user_id)
         ).delete(synchronize_session=False)
-        # 3. 사용자 및 프로필 삭제
+        TeamApplication.query.filter_by(user_id=user_id, status="PENDING").delete(synchronize_session=False)
+        TeamInvitation.query.filter(
+            (TeamInvitation.to_user_id == user_id) | (TeamInvitation.from_user_id == user_id),
+            TeamInvitation.status == "PENDING",
+        ).delete(synchronize_session=False)
+        NotificationOutbox.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+        TagService.delete_user_tags(user_id)
+        MatchingJobService.purge_user(user_id)
+        RankingService.forget_user(user_id)
+
+        # 4. 사용자 및 프로필 삭제 후 한 번에 커밋
         if user.profile:
             db.session.delete(user.profile)
         db.session.delete(user)
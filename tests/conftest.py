@@ -0,0 +1,71 @@
+"""
+pytest 공용 픽스처입니다.
+
+테스트마다 메모리 SQLite 데이터베이스로 앱을 만들고, 사용자/팀을 만드는
+간단한 헬퍼를 제공합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+# 저장소 루트를 import 경로에 추가하고, 앱이 만들어지기 전에 메모리 DB를 지정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["DATABASE_URL"] = "sqlite://"
+
+from app import create_app  # noqa: E402
+from database import db, upgrade_schema  # noqa: E402
+from services import ranking_service, team_service  # noqa: E402
+from services.team_service import TeamService  # noqa: E402
+from services.user_service import UserService  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    application = create_app()
+    application.config.update(TESTING=True, SECRET_KEY="test")
+    with application.app_context():
+        db.create_all()
+        upgrade_schema()
+        yield application
+        db.session.remove()
+        db.drop_all()
+    # 팀 라벨/매칭 점수 캐시는 프로세스 전역이므로 테스트 사이에 비움
+    team_service._label_names.clear()
+    ranking_service._score_cache.clear()
+
+
+@pytest.fixture
+def make_user(app):
+    counter = iter(range(1, 10_000))
+
+    def _make_user(name=None, skills=None, goals=None, personality=None):
+        n = next(counter)
+        return UserService.create_user(
+            username=f"user{n}",
+            password="pw",
+            name=name or f"사용자{n}",
+            student_no=f"2024{n:04d}",
+            school=None,
+            personality=personality,
+            goals=goals,
+            skills=skills,
+        )
+
+    return _make_user
+
+
+@pytest.fixture
+def make_team(app):
+    def _make_team(owner, name="팀", capacity=None, goal=None, required_skills=None, **kwargs):
+        return TeamService.create_team(
+            owner_id=owner.id,
+            name=name,
+            goal=goal,
+            required_skills=required_skills,
+            capacity=capacity,
+            **kwargs,
+        )
+
+    return _make_team
@@ -0,0 +1,94 @@
+import pytest
+
+from config import Config
+from database import db
+from models.team import Team
+from models.team_member import TeamMember
+from services.class_service import ClassService
+from services.matching_service import MatchingService
+
+
+@pytest.fixture
+def make_class(make_user):
+    def _make_class(students=0, **profile):
+        owner = make_user()
+        clazz = ClassService.create_class(owner.id, "자료구조", None)
+        members = [make_user(**profile) for _ in range(students)]
+        for member in members:
+            ClassService.join_class(member.id, clazz.code)
+        return owner, clazz, members
+
+    return _make_class
+
+
+def _team_of(user_id):
+    return db.session.query(TeamMember.team_id).filter_by(user_id=user_id).scalar()
+
+
+def test_auto_form_fills_existing_teams_up_to_capacity(make_class, make_team):
+    owner, clazz, students = make_class(4, skills="python")
+    team = make_team(owner, capacity=3, required_skills="python", class_id=clazz.id)  # 2자리 남음
+
+    result = ClassService.auto_form_teams(clazz.id, owner.id, team_size=2)
+
+    assert result == {"assigned": 4, "created": 1, "unassigned": 0}
+    assert db.session.get(Team, team.id).member_count == 3
+    assert TeamMember.query.filter_by(team_id=team.id).count() == 3
+
+
+def test_auto_form_puts_everyone_in_a_team_without_capacity(make_class, make_team):
+    owner, clazz, students = make_class(5)
+    team = make_team(owner, capacity=None, class_id=clazz.id)
+
+    result = ClassService.auto_form_teams(clazz.id, owner.id)
+
+    assert result == {"assigned": 5, "created": 0, "unassigned": 0}
+    assert {_team_of(s.id) for s in students} == {team.id}
+    assert db.session.get(Team, team.id).member_count == 6
+
+
+def test_auto_form_merges_a_single_leftover_into_the_previous_new_team(make_class):
+    owner, clazz, students = make_class(5)
+
+    result = ClassService.auto_form_teams(clazz.id, owner.id, team_size=2)
+
+    assert result == {"assigned": 5, "created": 2, "unassigned": 0}
+    sizes = sorted(t.member_count for t in Team.query.filter_by(class_id=clazz.id))
+    assert sizes == [2, 3]
+
+
+def test_auto_form_leaves_a_lone_member_unassigned(make_class, make_team):
+    owner, clazz, students = make_class(2)
+    make_team(owner, capacity=2, class_id=clazz.id)  # 1자리 남음
+
+    result = ClassService.auto_form_teams(clazz.id, owner.id)
+
+    assert result == {"assigned": 1, "created": 0, "unassigned": 1}
+    assert sum(_team_of(s.id) is None for s in students) == 1
+
+
+def test_auto_form_scores_on_the_process_pool(make_class, make_team, monkeypatch):
+    owner, clazz, students = make_class(6, skills="python,sql", goals="web")
+    teams = [
+        make_team(owner, capacity=4, required_skills="python", goal="web", class_id=clazz.id),
+        make_team(owner, capacity=4, required_skills="java", class_id=clazz.id),
+    ]
+    profiles = [("python,sql", None, "web")] * 6
+    expected = MatchingService.score_matrix(profiles, teams)
+
+    monkeypatch.setattr(Config, "AUTO_FORM_PARALLEL_THRESHOLD", 1)
+    monkeypatch.setattr(Config, "AUTO_FORM_WORKERS", 2)
+    assert MatchingService.score_matrix(profiles, teams) == expected
+
+    result = ClassService.auto_form_teams(clazz.id, owner.id)
+
+    assert result == {"assigned": 6, "created": 0, "unassigned": 0}
+    assert db.session.get(Team, teams[0].id).member_count == 4
+    assert db.session.get(Team, teams[1].id).member_count == 4
+
+
+def test_auto_form_rejects_teams_smaller_than_two(make_class):
+    owner, clazz, _ = make_class(2)
+
+    with pytest.raises(ValueError):
+        ClassService.auto_form_teams(clazz.id, owner.id, team_size=1)
@@ -0,0 +1,36 @@
+from database import db, upgrade_schema
+
+
+def _columns(table):
+    return {col["name"] for col in db.inspect(db.engine).get_columns(table)}
+
+
+def test_upgrade_schema_adds_missing_columns(app):
+    # 카운터 컬럼이 생기기 전의 teams 테이블로 되돌림
+    db.drop_all()
+    with db.engine.begin() as conn:
+        conn.execute(db.text("CREATE TABLE teams (id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL)"))
+        conn.execute(db.text("INSERT INTO teams (id, name) VALUES (1, 'old')"))
+    db.create_all()
+
+    upgrade_schema()
+    upgrade_schema()  # 여러 번 실행해도 안전
+
+    assert {"member_count", "version"} <= _columns("teams")
+    assert "unread_notification_count" in _columns("users")
+    assert "count" in _columns("notifications")
+    row = db.session.execute(db.text("SELECT member_count, version FROM teams WHERE id = 1")).one()
+    assert tuple(row) == (0, 1)
+
+
+def test_upgrade_columns_render_for_other_databases(app):
+    from sqlalchemy.dialects import postgresql
+
+    from database import SCHEMA_UPGRADES
+
+    dialect = postgresql.dialect()
+    compiler = dialect.ddl_compiler(dialect, None)
+    for table, column in SCHEMA_UPGRADES:
+        spec = compiler.get_column_specification(db.metadata.tables[table].c[column])
+        assert "DATETIME" not in spec
+        assert "NOT NULL" not in spec or "DEFAULT" in spec
@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+from database import db
+from models.matching_request import MatchingRequest
+from services.matching_job_service import MatchingJobService
+from services.user_service import UserService
+
+
+def test_stale_running_job_is_requeued(make_user, make_team):
+    team = make_team(make_user())
+    job = MatchingJobService.enqueue(team.id)
+    assert MatchingJobService.claim_next().id == job.id
+
+    assert MatchingJobService.requeue_stale() == 0
+    assert MatchingJobService.requeue_stale(datetime.utcnow() + timedelta(hours=1)) == 1
+    assert db.session.get(MatchingRequest, job.id).status == "PENDING"
+
+    assert MatchingJobService.run_pending() == 1
+    assert db.session.get(MatchingRequest, job.id).status == "DONE"
+
+
+def test_profile_edit_marks_results_outdated(make_user, make_team):
+    team = make_team(make_user(), required_skills="python")
+    candidate = make_user(skills="python")
+    MatchingJobService.enqueue(team.id)
+    MatchingJobService.run_pending()
+    assert not MatchingJobService.is_outdated(MatchingJobService.latest_done(team.id), team)
+
+    UserService.update_profile(candidate.id, None, None, None, None, "python, sql")
+
+    assert MatchingJobService.is_outdated(MatchingJobService.latest_done(team.id), team)
@@ -0,0 +1,60 @@
+import itertools
+
+from models.profile import Profile
+from models.team import Team
+from models.user import User
+from services.matching_service import MatchingService, encode_team, score_profile
+
+SKILLS = [None, "", "Python", "python, SQL", " java ,Python,go", "rust"]
+GOALS = [None, "", "web", "Web, app", "ai,web"]
+PERSONALITIES = [None, "", "active", "Calm"]
+TEAMS = [
+    (None, None),
+    ("python,sql", None),
+    ("Python, Go", "Build a web app with active people"),
+    (None, "ai web calm"),
+]
+
+
+def _user(skills, goals, personality):
+    user = User(username="u", password="x", name="u", student_no="1")
+    user.profile = Profile(skills=skills, goals=goals, personality=personality)
+    return user
+
+
+def test_score_profile_matches_calculate_score():
+    for required_skills, goal in TEAMS:
+        team = Team(name="t", required_skills=required_skills, goal=goal, owner_id=1)
+        vector = encode_team(required_skills, goal)
+        for skills, goals, personality in itertools.product(SKILLS, GOALS, PERSONALITIES):
+            expected = MatchingService.calculate_score(_user(skills, goals, personality), team)
+            assert score_profile(vector, skills, personality, goals) == expected
+
+
+def test_score_candidates_matches_calculate_score():
+    users = [_user(*fields) for fields in itertools.product(SKILLS, GOALS, PERSONALITIES)]
+    users.append(User(username="n", password="x", name="n", student_no="2"))  # 프로필 없음
+    for required_skills, goal in TEAMS:
+        team = Team(name="t", required_skills=required_skills, goal=goal, owner_id=1)
+        expected = [MatchingService.calculate_score(u, team) for u in users]
+        assert MatchingService.score_candidates(users, team) == expected
+
+
+def test_match_candidates_pages_follow_full_ranking():
+    team = Team(name="t", required_skills="python,sql,go", goal="web", owner_id=1)
+    users = [_user(*fields) for fields in itertools.product(SKILLS, GOALS, PERSONALITIES)]
+    full = MatchingService.match_candidates(users, team)
+    for offset, limit in [(0, 5), (5, 7), (len(users) - 3, 10)]:
+        page = MatchingService.match_candidates(users, team, limit=limit, offset=offset)
+        assert page == full[offset:offset + limit]
+
+
+def test_find_candidates_includes_personality_matches(make_user, make_team):
+    team = make_team(make_user(), goal="Looking for calm people")
+    calm = make_user(personality="calm")
+    make_user(personality="loud")
+
+    candidates = MatchingService.find_candidates(team)
+
+    assert [u.id for u in candidates] == [calm.id]
+    assert MatchingService.calculate_score(calm, team) == 1
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import Config
+from database import db
+from models.notification import Notification
+from models.notification_archive import NotificationArchive
+from services.notification_retention_service import NotificationRetentionService
+
+NOW = datetime(2024, 6, 1)
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    monkeypatch.setattr(Config, "NOTIFICATION_RETENTION_DAYS", 30)
+    monkeypatch.setattr(Config, "NOTIFICATION_MAX_PER_USER", 3)
+    monkeypatch.setattr(Config, "NOTIFICATION_RETENTION_BATCH", 2)
+    monkeypatch.setattr(Config, "NOTIFICATION_ARCHIVE", True)
+
+
+def _add(user_id, days_ago, read=True, type="INFO", related_id=None, count=1):
+    created = NOW - timedelta(days=days_ago)
+    notification = Notification(
+        user_id=user_id,
+        type=type,
+        message="m",
+        related_id=related_id,
+        created_at=created,
+        read_at=created if read else None,
+        count=count,
+    )
+    db.session.add(notification)
+    db.session.flush()
+    return notification.id
+
+
+def test_expired_read_notifications_are_archived(small_limits, make_user):
+    user = make_user()
+    old_read = _add(user.id, 40, count=4)
+    old_unread = _add(user.id, 40, read=False)
+    recent_read = _add(user.id, 1)
+    db.session.commit()
+
+    removed = NotificationRetentionService.run(NOW)
+
+    assert removed["expired"] == 1
+    assert {n.id for n in Notification.query} == {old_unread, recent_read}
+    archived = NotificationArchive.query.filter_by(original_id=old_read).one()
+    assert archived.user_id == user.id and archived.count == 4
+
+
+def test_orphaned_team_notifications_are_removed(small_limits, make_user, make_team):
+    user = make_user()
+    team = make_team(user)
+    live = _add(user.id, 1, type="REMOVED", related_id=team.id)
+    orphaned = _add(user.id, 1, type="REMOVED", related_id=team.id + 100)
+    unread_orphan = _add(user.id, 1, read=False, type="REMOVED", related_id=team.id + 100)
+    db.session.commit()
+
+    removed = NotificationRetentionService.run(NOW)
+
+    assert removed["orphaned"] == 1
+    ids = {n.id for n in Notification.query}
+    assert orphaned not in ids
+    assert {live, unread_orphan} <= ids
+
+
+def test_read_notifications_over_the_per_user_cap_are_removed(small_limits, make_user):
+    user = make_user()
+    other = make_user()
+    ids = [_add(user.id, days, read=days != 5) for days in range(7)]  # 0일 전 ~ 6일 전
+    other_ids = [_add(other.id, 0) for _ in range(3)]
+    db.session.commit()
+
+    removed = NotificationRetentionService.run(NOW)
+
+    # 최근 3개와 읽지 않은 알림(5일 전)만 남음, 한도 안의 다른 사용자는 그대로
+    assert removed["over_cap"] == 3
+    remaining = {n.id for n in Notification.query}
+    assert remaining == set(ids[:3]) | {ids[5]} | set(other_ids)
+
+
+def test_reused_notification_id_can_be_archived_again(small_limits, make_user):
+    user = make_user()
+    first = _add(user.id, 40)
+    db.session.commit()
+    assert NotificationRetentionService.run(NOW)["expired"] == 1
+
+    # 가장 큰 ID가 지워졌으므로 SQLite가 같은 ID를 다시 사용함
+    reused = _add(user.id, 40)
+    db.session.commit()
+    assert reused == first
+
+    assert NotificationRetentionService.run(NOW)["expired"] == 1
+    assert Notification.query.count() == 0
+    assert [a.original_id for a in NotificationArchive.query.order_by(NotificationArchive.id)] == [first, first]
+
+
+def test_orphaned_application_notifications_are_removed(small_limits, make_user):
+    user = make_user()
+    orphaned = _add(user.id, 1, type="APPLICATION", related_id=999)
+    db.session.commit()
+
+    assert NotificationRetentionService.run(NOW)["orphaned"] == 1
+    assert db.session.get(Notification, orphaned) is None
+
+
+def test_retention_without_archive_deletes(small_limits, monkeypatch, make_user):
+    monkeypatch.setattr(Config, "NOTIFICATION_ARCHIVE", False)
+    user = make_user()
+    _add(user.id, 40)
+    db.session.commit()
+
+    assert NotificationRetentionService.run(NOW)["expired"] == 1
+    assert Notification.query.count() == 0
+    assert NotificationArchive.query.count() == 0
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+from database import db
+from models.notification import Notification
+from services.notification_service import NotificationService
+
+
+def _unread_in_table(user_id):
+    return Notification.query.filter_by(user_id=user_id, read_at=None).count()
+
+
+def _deliver(user, team, times):
+    for _ in range(times):
+        NotificationService.enqueue([{
+            "user_id": user.id,
+            "type": "APPLICATION",
+            "message": f"[카테고리: 공모전] {team.name}팀에 새 지원이 도착했습니다.",
+            "related_id": team.id,
+        }])
+        db.session.commit()
+        assert NotificationService.dispatch_outbox() == 1
+
+
+def test_unread_counter_follows_send_and_read(make_user):
+    user = make_user()
+    NotificationService.send_many(
+        {"user_id": user.id, "type": "INFO", "message": f"알림 {i}"} for i in range(3)
+    )
+    first = NotificationService.send_notification(user.id, "INFO", "하나 더")
+    assert NotificationService.unread_count(user.id) == 4
+
+    NotificationService.mark_as_read(first.id, user.id)
+    NotificationService.mark_as_read(first.id, user.id)  # 두 번 읽어도 한 번만 감소
+    assert NotificationService.unread_count(user.id) == 3
+
+    assert NotificationService.mark_all_read(user.id) == 3
+    assert NotificationService.unread_count(user.id) == 0
+
+
+def test_reconcile_unread_counts_fixes_drift(make_user):
+    user = make_user()
+    NotificationService.send_many(
+        {"user_id": user.id, "type": "INFO", "message": f"알림 {i}"} for i in range(2)
+    )
+    user.unread_notification_count = 7
+    db.session.commit()
+
+    assert NotificationService.reconcile_unread_counts() == 1
+    assert NotificationService.unread_count(user.id) == 2
+    assert NotificationService.reconcile_unread_counts() == 0
+
+
+def test_repeated_applications_are_coalesced(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader, name="알파")
+    _deliver(leader, team, 1)
+    first_id = NotificationService.latest_id(leader.id)
+
+    _deliver(leader, team, 2)
+
+    rows = Notification.query.filter_by(user_id=leader.id).all()
+    assert len(rows) == 1
+    merged = rows[0]
+    assert merged.count == 3
+    assert merged.message == "[카테고리: 공모전] 알파팀에 새 지원이 3건 도착했습니다."
+    # 합쳐진 알림은 새 ID를 받아 열린 스트림(id > last_id)에 다시 전달됨
+    assert merged.id > first_id
+    assert [n.id for n in NotificationService.list_since(leader.id, first_id)] == [merged.id]
+    assert NotificationService.unread_count(leader.id) == _unread_in_table(leader.id) == 1
+
+
+def test_read_notification_is_not_coalesced(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader)
+    _deliver(leader, team, 1)
+    NotificationService.mark_all_read(leader.id)
+
+    _deliver(leader, team, 1)
+
+    assert sorted(n.count for n in Notification.query.filter_by(user_id=leader.id)) == [1, 1]
+    assert NotificationService.unread_count(leader.id) == _unread_in_table(leader.id) == 1
+
+
+def test_list_for_user_continues_after_cursor_row_is_merged(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader)
+    NotificationService.send_many(
+        {"user_id": leader.id, "type": "INFO", "message": f"이전 {i}"} for i in range(3)
+    )
+    _deliver(leader, team, 1)
+    page, cursor = NotificationService.list_for_user(leader.id, limit=1)
+    assert page[0].type == "APPLICATION"
+
+    # 커서가 가리키던 행이 새 지원과 합쳐지며 삭제되어도 다음 페이지를 읽을 수 있어야 함
+    _deliver(leader, team, 1)
+    rest, _ = NotificationService.list_for_user(
+        leader.id, limit=10, before=NotificationService.decode_cursor(NotificationService.encode_cursor(*cursor))
+    )
+    assert [n.message for n in rest] == ["이전 2", "이전 1", "이전 0"]
+
+
+def test_list_for_user_pages_without_duplicates_or_gaps(make_user):
+    user = make_user()
+    other = make_user()
+    base = datetime(2024, 1, 1)
+    # 같은 시각의 알림이 여러 개 있어도 (created_at, id) 순서로 끊김 없이 이어져야 함
+    rows = [
+        {"user_id": user.id, "type": "INFO", "message": str(i), "created_at": base + timedelta(minutes=i // 4)}
+        for i in range(23)
+    ] + [{"user_id": other.id, "type": "INFO", "message": "x", "created_at": base}]
+    db.session.execute(db.insert(Notification), rows)
+    db.session.commit()
+    expected = [
+        n.id for n in Notification.query.filter_by(user_id=user.id)
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+    ]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = NotificationService.list_for_user(user.id, limit=5, before=cursor)
+        seen.extend(n.id for n in page)
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert len(seen) == 23
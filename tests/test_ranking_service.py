@@ -0,0 +1,88 @@
+from database import db
+from models.category import Category
+from services.class_service import ClassService
+from services.ranking_service import RankingService
+from services.team_service import TeamService
+from services.user_service import UserService
+
+
+def _rank(user, **kwargs):
+    page, cursor = RankingService.rank_teams(user.id, **kwargs)
+    return [(team.id, score) for team, score in page], cursor
+
+
+def test_rank_teams_orders_by_score_then_id_and_pages(make_user, make_team):
+    owner = make_user()
+    low = make_team(owner, required_skills="python")
+    none = make_team(owner, required_skills="go")
+    high = make_team(owner, required_skills="python,sql")
+    tie = make_team(owner, required_skills="sql")
+    user = make_user(skills="python,sql")
+
+    first, cursor = _rank(user, limit=2)
+    assert first == [(high.id, 2), (tie.id, 1)]
+    assert cursor == (1, tie.id)
+
+    second, cursor = _rank(user, limit=2, after=cursor)
+    assert second == [(low.id, 1), (none.id, 0)]
+    assert cursor is None
+
+
+def test_rank_teams_serves_repeat_views_from_the_cache(make_user, make_team):
+    owner = make_user()
+    make_team(owner, required_skills="python")
+    make_team(owner, required_skills="sql")
+    user = make_user(skills="python")
+
+    first = _rank(user)
+    misses = RankingService.cache_stats()["misses"]
+
+    assert _rank(user) == first
+    stats = RankingService.cache_stats()
+    assert stats["misses"] == misses
+    assert stats["hits"] >= 2
+
+
+def test_rank_teams_recomputes_after_profile_and_team_edits(make_user, make_team):
+    owner = make_user()
+    team = make_team(owner, required_skills="python")
+    user = make_user(skills="python")
+    assert _rank(user)[0] == [(team.id, 1)]
+
+    UserService.update_profile(user.id, None, None, None, None, "go")
+    assert _rank(user)[0] == [(team.id, 0)]
+
+    TeamService.update_team(team, team.name, None, "go,rust", None, None)
+    assert _rank(user)[0] == [(team.id, 1)]
+
+
+def test_rank_teams_does_not_serve_scores_of_a_dissolved_team(make_user, make_team):
+    owner = make_user()
+    make_team(owner, required_skills="go")
+    old = make_team(owner, required_skills="python")
+    user = make_user(skills="python")
+    assert _rank(user)[0][0] == (old.id, 1)
+
+    TeamService.dissolve_team(old.id, owner.id)
+    new = make_team(owner, required_skills="rust")  # SQLite는 마지막 팀 ID를 다시 씁니다
+
+    assert dict(_rank(user)[0])[new.id] == 0
+
+
+def test_recommend_teams_loads_class_and_category_labels(make_user, make_team):
+    owner = make_user()
+    clazz = ClassService.create_class(owner.id, "자료구조", None)
+    category = Category(name="공모전")
+    db.session.add(category)
+    db.session.commit()
+    make_team(owner, required_skills="python", class_id=clazz.id)
+    make_team(owner, required_skills="python", category_id=category.id)
+    user = make_user(skills="python")
+    ClassService.join_class(user.id, clazz.code)
+    db.session.expire_all()
+
+    page, _ = RankingService.recommend_teams(user.id, [clazz.id])
+
+    assert len(page) == 2
+    for team, _ in page:
+        assert "class_room" in team.__dict__ and "category" in team.__dict__
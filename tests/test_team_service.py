@@ -0,0 +1,93 @@
+import pytest
+
+from database import db
+from models.team import Team
+from models.team_application import TeamApplication
+from models.team_member import TeamMember
+from services.team_service import TeamService
+
+
+def test_claim_seat_refuses_to_exceed_capacity(make_user, make_team):
+    team = make_team(make_user(), capacity=3)  # 팀장 포함 1명
+
+    assert TeamService.claim_seat(team.id, 2)
+    assert not TeamService.claim_seat(team.id)
+    db.session.commit()
+    assert db.session.get(Team, team.id).member_count == 3
+
+
+def test_claim_seat_without_capacity_always_succeeds(make_user, make_team):
+    team = make_team(make_user(), capacity=None)
+
+    assert TeamService.claim_seat(team.id, 50)
+    db.session.commit()
+    assert db.session.get(Team, team.id).member_count == 51
+
+
+def test_release_seat_frees_a_seat_and_never_goes_negative(make_user, make_team):
+    team = make_team(make_user(), capacity=2)
+    assert TeamService.claim_seat(team.id)
+    assert not TeamService.claim_seat(team.id)
+
+    TeamService.release_seat(team.id)
+    assert TeamService.claim_seat(team.id)
+    TeamService.release_seat(team.id, 10)
+    db.session.commit()
+    assert db.session.get(Team, team.id).member_count == 0
+
+
+def _apply(team, users):
+    for user in users:
+        TeamService.apply_to_team(team.id, user.id)
+
+
+def test_process_applications_by_score_stops_at_capacity(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader, capacity=3, required_skills="python,sql")
+    weak = make_user(skills="java")
+    strong = make_user(skills="python, sql")
+    medium = make_user(skills="python")
+    _apply(team, [weak, strong, medium])
+
+    result = TeamService.process_applications(team.id, leader.id, accept=True)
+
+    assert result == {"accepted": 2, "rejected": 0}
+    members = {m.user_id for m in TeamMember.query.filter_by(team_id=team.id)}
+    assert members == {leader.id, strong.id, medium.id}
+    assert db.session.get(Team, team.id).member_count == 3
+    assert TeamApplication.query.filter_by(user_id=weak.id).one().status == "PENDING"
+
+
+def test_process_applications_selected_ids_reject_overflow(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader, capacity=2)
+    applicants = [make_user() for _ in range(3)]
+    _apply(team, applicants)
+    ids = [a.id for a in TeamApplication.query.order_by(TeamApplication.id)]
+
+    result = TeamService.process_applications(team.id, leader.id, accept=True, application_ids=ids)
+
+    assert result == {"accepted": 1, "rejected": 2}
+    assert db.session.get(Team, team.id).member_count == 2
+    statuses = [a.status for a in TeamApplication.query.order_by(TeamApplication.id)]
+    assert statuses == ["ACCEPTED", "REJECTED", "REJECTED"]
+
+
+@pytest.mark.parametrize("top_n", [0, -1])
+def test_process_applications_rejects_top_n_below_one(make_user, make_team, top_n):
+    leader = make_user()
+    team = make_team(leader, capacity=3)
+    _apply(team, [make_user()])
+
+    with pytest.raises(ValueError):
+        TeamService.process_applications(team.id, leader.id, accept=True, top_n=top_n)
+    assert TeamApplication.query.one().status == "PENDING"
+
+
+def test_process_applications_requires_leader(make_user, make_team):
+    team = make_team(make_user(), capacity=2)
+    other = make_user()
+    _apply(team, [other])
+
+    with pytest.raises(ValueError):
+        TeamService.process_applications(team.id, other.id, accept=True)
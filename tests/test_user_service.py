@@ -0,0 +1,42 @@
+import pytest
+
+from database import db
+from models.team import Team
+from models.team_member import TeamMember
+from models.user import User
+from services.team_service import TeamService
+from services.user_service import UserService
+
+
+def _join(team, user):
+    assert TeamService.claim_seat(team.id)
+    db.session.add(TeamMember(team_id=team.id, user_id=user.id, role="MEMBER"))
+    db.session.commit()
+
+
+def test_delete_user_keeps_member_count_consistent(make_user, make_team):
+    leaders = [make_user() for _ in range(3)]
+    teams = [make_team(leader, name=f"팀{i}", capacity=4) for i, leader in enumerate(leaders)]
+    leaving = make_user()
+    staying = make_user()
+    for team in teams[:2]:
+        _join(team, leaving)
+    _join(teams[0], staying)
+
+    UserService.delete_user(leaving.id)
+
+    assert db.session.get(User, leaving.id) is None
+    assert TeamMember.query.filter_by(user_id=leaving.id).count() == 0
+    assert [db.session.get(Team, t.id).member_count for t in teams] == [2, 1, 1]
+    # 저장된 팀원 수가 실제 팀원 수와 일치하므로 보정할 팀이 없음
+    assert TeamService.reconcile_member_counts() == 0
+
+
+def test_delete_user_blocks_leader_of_team_with_members(make_user, make_team):
+    leader = make_user()
+    team = make_team(leader, capacity=4)
+    _join(team, make_user())
+
+    with pytest.raises(ValueError):
+        UserService.delete_user(leader.id)
+    assert db.session.get(Team, team.id).member_count == 2
@@ -0,0 +1,131 @@
+"""
+Cache utilities.
+
+Provides a TTL cache for short strings such as class and category
+names, used to build team labels without a database round trip, and an
+LRU cache for team/user match scores stamped with the versions they were
+computed from.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 10000) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Store a value, evicting the oldest entries past ``maxsize``."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ScoreCache:
+    """Thread-safe LRU cache of scores keyed by (team_id, user_id) with hit/miss counters.
+
+    Each score is stored with the (profile version, team version) it was
+    computed from and is only served for the same versions, so a score is
+    never returned after either side was edited.
+    """
+
+    def __init__(self, maxsize: int = 50000) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[Hashable, int]]" = OrderedDict()
+        self._by_team: Dict[int, Set[int]] = {}
+        self._by_user: Dict[int, Set[int]] = {}
+        self._lock = Lock()
+
+    def get(self, team_id: int, user_id: int, versions: Hashable) -> Optional[int]:
+        """Return the cached score, or None if missing or computed from other versions."""
+        key = (team_id, user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, team_id: int, user_id: int, versions: Hashable, score: int) -> None:
+        """Store a score, evicting the least recently used entries past ``maxsize``."""
+        key = (team_id, user_id)
+        with self._lock:
+            self._entries[key] = (versions, score)
+            self._entries.move_to_end(key)
+            self._by_team.setdefault(team_id, set()).add(user_id)
+            self._by_user.setdefault(user_id, set()).add(team_id)
+            while len(self._entries) > self.maxsize:
+                (old_team, old_user), _ = self._entries.popitem(last=False)
+                self._unlink(old_team, old_user)
+
+    def invalidate_team(self, team_id: int) -> None:
+        """Drop every cached score of a team."""
+        with self._lock:
+            for user_id in list(self._by_team.get(team_id, ())):
+                self._entries.pop((team_id, user_id), None)
+                self._unlink(team_id, user_id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached score of a user."""
+        with self._lock:
+            for team_id in list(self._by_user.get(user_id, ())):
+                self._entries.pop((team_id, user_id), None)
+                self._unlink(team_id, user_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_team.clear()
+            self._by_user.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _unlink(self, team_id: int, user_id: int) -> None:
+        """Remove one (team, user) pair from the lookup indexes; the lock must be held."""
+        users = self._by_team.get(team_id)
+        if users is not None:
+            users.discard(user_id)
+            if not users:
+                del self._by_team[team_id]
+        teams = self._by_user.get(user_id)
+        if teams is not None:
+            teams.discard(team_id)
+            if not teams:
+                del self._by_user[user_id]
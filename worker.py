@@ -0,0 +1,134 @@
+"""
+백그라운드 작업 워커입니다.
+
+웹 요청 스레드에서 처리하기 무거운 작업(알림 아웃박스 전달, 매칭 후보 순위 계산 등)을
+데이터베이스 작업 큐에서 가져와 처리하고, 알림 카운터 보정이나 오래된 알림
+정리 같은 주기 작업도 실행합니다. 별도 프로세스로 실행하거나
+(``python worker.py``), 개발 환경에서는 ``app.py`` 실행 시 함께 시작됩니다.
+"""
+
+import threading
+import time
+
+from flask import Flask
+
+from config import Config
+from database import db, upgrade_schema
+
+
+def run_once(app: Flask) -> int:
+    """Deliver queued notifications and process every queued job once.
+
+    Returns the number of notifications and jobs handled.
+    """
+    from services.matching_job_service import MatchingJobService
+    from services.notification_service import NotificationService
+
+    with app.app_context():
+        try:
+            handled = 0
+            # 알림 아웃박스를 먼저 비워 알림이 매칭 계산에 밀려 늦어지지 않도록 함
+            while True:
+                delivered = NotificationService.dispatch_outbox()
+                if not delivered:
+                    break
+                handled += delivered
+            return handled + MatchingJobService.run_pending()
+        finally:
+            db.session.remove()
+
+
+def requeue_stale_matching(app: Flask) -> int:
+    """Requeue matching jobs left RUNNING by a stopped worker and return how many."""
+    from services.matching_job_service import MatchingJobService
+
+    with app.app_context():
+        try:
+            requeued = MatchingJobService.requeue_stale()
+        finally:
+            db.session.remove()
+    if requeued:
+        app.logger.warning("requeued %d stale matching jobs", requeued)
+    return requeued
+
+
+def reconcile_unread(app: Flask) -> int:
+    """Fix drifted unread-notification counters and return how many changed."""
+    from services.notification_service import NotificationService
+
+    with app.app_context():
+        try:
+            return NotificationService.reconcile_unread_counts()
+        finally:
+            db.session.remove()
+
+
+def compact_notifications(app: Flask) -> int:
+    """Apply the notification retention policy and return the rows removed."""
+    from services.notification_retention_service import NotificationRetentionService
+
+    with app.app_context():
+        try:
+            removed = NotificationRetentionService.run()
+        finally:
+            db.session.remove()
+    if any(removed.values()):
+        app.logger.info("notification retention: %s", removed)
+    return sum(removed.values())
+
+
+# (작업 함수, 실행 주기(초)) 목록. 워커 시작 시 한 번, 이후 주기마다 한 번씩 실행됩니다.
+PERIODIC_TASKS = [
+    (requeue_stale_matching, Config.MATCHING_STALE_CHECK_INTERVAL),
+    (reconcile_unread, Config.UNREAD_RECONCILE_INTERVAL),
+    (compact_notifications, Config.NOTIFICATION_RETENTION_INTERVAL),
+]
+
+
+def run_periodic(app: Flask, last_run: dict) -> None:
+    """Run every periodic task whose interval has elapsed since ``last_run``."""
+    now = time.monotonic()
+    for task, interval in PERIODIC_TASKS:
+        if now - last_run.get(task, float("-inf")) < interval:
+            continue
+        last_run[task] = now
+        try:
+            task(app)
+        except Exception as exc:  # 주기 작업 실패가 작업 큐 처리를 막지 않도록 함
+            app.logger.exception("periodic task %s failed: %s", task.__name__, exc)
+
+
+def run_forever(app: Flask, poll_interval: float = Config.WORKER_POLL_INTERVAL) -> None:
+    """Poll the job queue and run periodic tasks until the process exits."""
+    last_run: dict = {}
+    while True:
+        run_periodic(app, last_run)
+        try:
+            handled = run_once(app)
+        except Exception as exc:  # 워커가 멈추지 않도록 로그만 남기고 계속 진행
+            app.logger.exception("background worker error: %s", exc)
+            handled = 0
+        if not handled:
+            time.sleep(poll_interval)
+
+
+def start_in_thread(app: Flask) -> threading.Thread:
+    """Run the worker loop in a daemon thread next to the web server."""
+    thread = threading.Thread(target=run_forever, args=(app,), name="background-worker", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    from app import create_app
+
+    application = create_app()
+    # 웹 서버보다 먼저 시작해도 되도록 테이블/컬럼 준비, 매칭용 태그 색인 구축, 팀원 수 보정
+    with application.app_context():
+        db.create_all()
+        upgrade_schema()
+        from services.tag_service import TagService
+        from services.team_service import TeamService
+        TagService.ensure_index()
+        TeamService.reconcile_member_counts()
+    run_forever(application)